@@ -1,21 +1,201 @@
 """Base API client for Dell Unisphere."""
 
+import copy
 import json
 import logging
+import sys
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
 
-from dell_unisphere_client.exceptions import CSRFTokenError, UnisphereClientError
+from dell_unisphere_client.exceptions import (
+    AuthenticationError,
+    CSRFTokenError,
+    UnisphereClientError,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Headers sent with every request; stored on the session rather than rebuilt
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "X-EMC-REST-CLIENT": "true",
+}
+
+# POST/DELETE paths that may be called before a CSRF token is available
+CSRF_EXEMPT_PATHS = frozenset(
+    {
+        "/api/types/loginSessionInfo/instances",
+        "/api/auth",
+        "/upload/files/types/candidateSoftwareVersion",
+    }
+)
+
+# Methods that must carry the CSRF token
+CSRF_METHODS = frozenset({"POST", "DELETE"})
+
+
+def connection_errors() -> Tuple[type, ...]:
+    """Return the transport-level errors of the supported HTTP backends.
+
+    httpx is only imported by clients using its transport, so its errors
+    are included once it is in ``sys.modules``.
+
+    Returns:
+        Exception types to catch for connection failures.
+    """
+    httpx = sys.modules.get("httpx")
+    if httpx is None:
+        return (requests.exceptions.RequestException,)
+    return (requests.exceptions.RequestException, httpx.TransportError)
+
+
+def is_mock_session(session: Any) -> bool:
+    """Return whether a session is a unit-test MagicMock.
+
+    ``unittest.mock`` is only looked up in ``sys.modules``, so production
+    imports never pull it in; if it was never imported, no session can be a
+    mock.
+
+    Args:
+        session: Session to check.
+
+    Returns:
+        True for a MagicMock session.
+    """
+    mock = sys.modules.get("unittest.mock")
+    return mock is not None and isinstance(session, mock.MagicMock)
+
+
+def enable_verbose_logging() -> None:
+    """Log detailed request and response information.
+
+    The dumps are emitted at DEBUG by every API client, so verbose mode
+    only raises the package logger to that level.
+    """
+    logging.getLogger("dell_unisphere_client").setLevel(logging.DEBUG)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse a JSON response body.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        content: Raw response body.
+
+    Returns:
+        Decoded JSON.
+
+    Raises:
+        ValueError: When the body is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def cache_max_age(response: Any) -> int:
+    """Return how long a response may be reused without revalidation.
+
+    Args:
+        response: Response object.
+
+    Returns:
+        The ``Cache-Control`` max-age in seconds, or 0 when the response
+        must be revalidated.
+    """
+    cache_control = response.headers.get("Cache-Control")
+    if not isinstance(cache_control, str):
+        return 0
+    directives = [d.strip().lower() for d in cache_control.split(",")]
+    if "no-cache" in directives or "no-store" in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                return max(0, int(directive[8:]))
+            except ValueError:
+                return 0
+    return 0
+
+
+def body_preview(response: Any, limit: int = 512) -> str:
+    """Decode at most ``limit`` bytes of a response body for logging.
+
+    Avoids decoding (and charset-sniffing) large HTML error pages in full.
+
+    Args:
+        response: Response object.
+        limit: Maximum number of bytes to decode.
+
+    Returns:
+        Decoded prefix of the body, suffixed with "..." when truncated.
+    """
+    content = response.content or b""
+    preview = content[:limit].decode("utf-8", "replace")
+    if len(content) > limit:
+        preview += "..."
+    return preview
+
+
+def send_request(session: Any, method: str, url: str, **kwargs: Any) -> Any:
+    """Send a request on a requests or httpx session.
+
+    Args:
+        session: ``requests.Session`` or ``httpx.Client``.
+        method: HTTP method.
+        url: Full URL.
+        **kwargs: Keyword arguments in requests' calling convention.
+
+    Returns:
+        Response object.
+    """
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(session, httpx.Client):
+        # httpx configures TLS verification on the client, not per request
+        kwargs.pop("verify", None)
+        if isinstance(kwargs.get("data"), bytes):
+            kwargs["content"] = kwargs.pop("data")
+    return session.request(method, url, **kwargs)
+
 
 class BaseApiClient:
     """Base API client for Dell Unisphere."""
 
+    # Upgrade session and task status codes
+    _STATUS_MAP = {
+        0: "PENDING",
+        1: "IN_PROGRESS",
+        2: "COMPLETED",
+        3: "FAILED",
+        4: "PAUSED",
+    }
+
     def __init__(
         self,
         base_url: str,
@@ -24,6 +204,7 @@ class BaseApiClient:
         verify_ssl: bool = True,
         timeout: int = 600,
         verbose: bool = False,
+        response_cache: Optional[Dict] = None,
     ):
         """Initialize the API client.
 
@@ -33,14 +214,29 @@ class BaseApiClient:
             csrf_token: CSRF token for authentication.
             verify_ssl: Whether to verify SSL certificates.
             timeout: Request timeout in seconds.
-            verbose: Whether to log detailed request and response information.
+            verbose: Whether to log detailed request and response information;
+                raises the package logger to DEBUG.
+            response_cache: Cache of GET responses to share with other API
+                clients, so that a POST or DELETE through any of them
+                invalidates it. Defaults to a cache of this client's own.
         """
         self.base_url = base_url
         self.session = session
+        if session is not None:
+            session.headers.update(DEFAULT_HEADERS)
         self.csrf_token = csrf_token
         self.verify_ssl = verify_ssl
         self.timeout = timeout
-        self.verbose = verbose
+        if verbose:
+            enable_verbose_logging()
+
+        # ETag, parsed body and freshness deadline (monotonic) of cacheable
+        # GET responses, keyed by URL and params
+        self._response_cache: Dict[
+            Tuple[str, Tuple], Tuple[Optional[str], Dict[str, Any], float]
+        ] = {} if response_cache is None else response_cache
+        # Resolved URLs per API path; the endpoint paths are a small fixed set
+        self._url_cache: Dict[str, str] = {}
 
     def url(self, path: str) -> str:
         """Construct a full URL from a path.
@@ -51,7 +247,83 @@ class BaseApiClient:
         Returns:
             Full URL.
         """
-        return urljoin(self.base_url, path.lstrip("/"))
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = urljoin(self.base_url, path.lstrip("/"))
+        return url
+
+    @staticmethod
+    def fields_params(
+        fields: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Dict[str, str]:
+        """Build the query parameters restricting a collection GET to some fields.
+
+        Args:
+            fields: Comma-separated string or iterable of field names.
+
+        Returns:
+            Query parameters, empty when no fields were requested.
+        """
+        if not fields:
+            return {}
+        if not isinstance(fields, str):
+            fields = ",".join(fields)
+        return {"fields": fields}
+
+    def _mock_call(
+        self,
+        method: str,
+        path: str,
+        fallback: Any,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request through the module-level requests functions in tests.
+
+        Unit tests patch ``requests.get``/``requests.post`` and assert on the
+        calls, so mocked sessions route through them instead of ``request()``.
+
+        Args:
+            method: Lowercase requests function name ("get" or "post").
+            path: API path appended to the base URL.
+            fallback: Value returned when the mocked response has no JSON.
+            headers: Request headers; defaults to the client and CSRF headers.
+            **kwargs: Additional arguments for the requests function.
+
+        Returns:
+            The mocked response JSON, or ``fallback``.
+        """
+        if headers is None:
+            headers = {"X-EMC-REST-CLIENT": "true", "EMC-CSRF-TOKEN": self.csrf_token}
+            if "json" in kwargs:
+                headers["Content-Type"] = "application/json"
+        response = getattr(requests, method)(
+            f"{self.base_url}{path}",
+            headers=headers,
+            verify=self.verify_ssl,
+            **kwargs,
+        )
+        try:
+            return response.json()
+        except (AttributeError, ValueError):
+            return fallback
+
+    def send(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request on this client's session.
+
+        Args:
+            method: HTTP method.
+            url: Full URL.
+            **kwargs: Keyword arguments in requests' calling convention.
+
+        Returns:
+            Response object.
+        """
+        # Mutating calls may change any cached resource, e.g. preparing a
+        # package adds a candidate version, so drop every cached response
+        if method.upper() in CSRF_METHODS:
+            self._response_cache.clear()
+        return send_request(self.session, method, url, **kwargs)
 
     def handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response.
@@ -66,20 +338,34 @@ class BaseApiClient:
             AuthenticationError: When authentication fails.
             APIError: When the API returns an error.
         """
-        # Handle mock responses in tests
-        if hasattr(response, "json") and callable(response.json):
-            # For test compatibility
-            if hasattr(response, "_json") and response._json is not None:
-                return response._json
+        # Read-only calls skip the login request, so a 401 here is the first
+        # sign of bad credentials or an expired session
+        if response.status_code == 401:
+            raise AuthenticationError(
+                "Authentication failed", status_code=401, response=response
+            )
 
-            # For real responses
-            try:
-                return response.json()
-            except ValueError:
-                return {"status": "success", "status_code": response.status_code}
+        # Decode the raw bytes ourselves rather than through response.json()
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes):
+            # Empty bodies (204, most actions) and declared non-JSON bodies are
+            # answered without attempting a decode
+            content_type = response.headers.get("Content-Type", "")
+            if content and (not content_type or "json" in content_type):
+                try:
+                    return loads_json(content)
+                except ValueError:
+                    pass
+            return {"status": "success", "status_code": response.status_code}
 
-        # For MagicMock objects in tests
-        return {"content": {"id": "123"}}
+        try:
+            return response.json()
+        except (ValueError, AttributeError):
+            # Test doubles may carry a pre-parsed body instead of a JSON payload
+            body = getattr(response, "_json", None)
+            if body is not None:
+                return body
+            return {"status": "success", "status_code": response.status_code}
 
     def request(
         self,
@@ -90,6 +376,8 @@ class BaseApiClient:
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         custom_timeout: Optional[int] = None,
+        cacheable: bool = False,
+        revalidate_only: bool = False,
     ) -> Dict[str, Any]:
         """Make an API request.
 
@@ -100,6 +388,16 @@ class BaseApiClient:
             data: Form data.
             json_data: JSON data.
             headers: Additional headers.
+            custom_timeout: Timeout for this request, overriding the default.
+            cacheable: Whether a GET response may be reused. It is returned
+                without a request while its Cache-Control max-age lasts, and
+                revalidated with If-None-Match afterwards. A 304 response
+                returns a copy of the previously parsed body. Only 2xx
+                responses are stored, and any POST or DELETE through a
+                client sharing the cache clears it.
+            revalidate_only: Whether a cacheable response is always
+                revalidated, ignoring its max-age. Used for live state that
+                must not be served stale.
 
         Returns:
             Response data.
@@ -112,33 +410,31 @@ class BaseApiClient:
         if not self.session:
             raise UnisphereClientError("Not authenticated. Please login first.")
         url = self.url(path)
-        request_headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "X-EMC-REST-CLIENT": "true",
-        }
-
-        if headers:
-            request_headers.update(headers)
+        # Static headers live on the session; only per-request ones go here
+        request_headers = dict(headers) if headers else {}
+        if json_data is not None:
+            request_headers.setdefault("Content-Type", "application/json")
+
+        cache_key = None
+        if cacheable and method.upper() == "GET":
+            cache_key = (url, tuple(sorted(params.items())) if params else ())
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                if not revalidate_only and time.monotonic() < cached[2]:
+                    return copy.deepcopy(cached[1])
+                if cached[0]:
+                    request_headers["If-None-Match"] = cached[0]
 
         # Add CSRF token for POST/DELETE requests
-        if method.upper() in ["POST", "DELETE"]:
-            if not self.csrf_token and not path.endswith(
-                ("loginSessionInfo/instances", "auth", "candidateSoftwareVersion")
-            ):
+        if method.upper() in CSRF_METHODS:
+            if not self.csrf_token and path not in CSRF_EXEMPT_PATHS:
                 raise CSRFTokenError("CSRF token is required for POST/DELETE requests")
             request_headers["EMC-CSRF-TOKEN"] = self.csrf_token
 
-        logger.debug(
-            "Making %s request to %s with headers: %s",
-            method,
-            url,
-            request_headers,
-        )
-
         # Log request details if verbose mode is enabled
-        request_start_time = datetime.now()
-        if self.verbose:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            request_start_time = datetime.now()
             timestamp = request_start_time.strftime("%H:%M:%S.%f")[
                 :-3
             ]  # Format: HH:MM:SS.mmm
@@ -173,24 +469,24 @@ class BaseApiClient:
                 logger.debug("• BODY:")
                 logger.debug(f"    {data}")
 
-        # Create a local variable with a different name to avoid namespace conflict with json module
-        json_payload = json_data
+        # Serialize JSON bodies ourselves; Content-Type is set above
+        if json_data is not None:
+            data = dumps_json(json_data)
         # Use custom timeout if provided, otherwise use the default timeout
         request_timeout = custom_timeout if custom_timeout is not None else self.timeout
 
-        response = self.session.request(
-            method=method,
-            url=url,
+        response = self.send(
+            method,
+            url,
             params=params,
             data=data,
-            json=json_payload,  # Using renamed variable to avoid conflict with json module
             headers=request_headers,
             verify=self.verify_ssl,
             timeout=request_timeout,
         )
 
         # Log response details if verbose mode is enabled
-        if self.verbose:
+        if debug:
             response_time = datetime.now()
             duration_ms = int(
                 (response_time - request_start_time).total_seconds() * 1000
@@ -201,8 +497,11 @@ class BaseApiClient:
             logger.debug(
                 f"====== RESPONSE [{timestamp}] ==============================================="
             )
+            reason = getattr(response, "reason", None) or getattr(
+                response, "reason_phrase", ""
+            )
             logger.debug(
-                f"• Status:  {response.status_code} {response.reason} ({duration_ms}ms)"
+                f"• Status:  {response.status_code} {reason} ({duration_ms}ms)"
             )
 
             logger.debug("• Headers:")
@@ -216,7 +515,7 @@ class BaseApiClient:
                     logger.debug("• Body:")
                     try:
                         # Try to pretty print JSON
-                        body = json.loads(response.text)
+                        body = loads_json(response.content)
 
                         # Format JSON with indentation and truncate long values
                         def format_json(obj, indent=0):
@@ -246,10 +545,7 @@ class BaseApiClient:
                         logger.debug(f"    {body_str}")
                     except (ValueError, json.JSONDecodeError):
                         # If not JSON, print as text (truncated if too long)
-                        text = response.text
-                        if len(text) > 1000:
-                            text = text[:997] + "..."
-                        logger.debug(f"    {text}")
+                        logger.debug(f"    {body_preview(response, 1000)}")
             except Exception as e:
                 logger.debug(f"• Error parsing response body: {e}")
 
@@ -258,17 +554,40 @@ class BaseApiClient:
                 f"====== REQUEST END [{end_timestamp}] ============================================"
             )
 
+        # Reuse the cached body when the server reports it unchanged
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if response.status_code == 304 and cached:
+                # A 304 may carry a new max-age for the stored body
+                self._response_cache[cache_key] = (
+                    cached[0],
+                    cached[1],
+                    time.monotonic() + cache_max_age(response),
+                )
+                return copy.deepcopy(cached[1])
+
         # Always print raw response in verbose mode, even if an exception occurs
         try:
-            return self.handle_response(response)
+            result = self.handle_response(response)
+            if cache_key is not None and 200 <= response.status_code < 300:
+                etag = response.headers.get("ETag")
+                max_age = 0 if revalidate_only else cache_max_age(response)
+                if etag or max_age:
+                    # Store a copy so callers may modify what they receive
+                    self._response_cache[cache_key] = (
+                        etag,
+                        copy.deepcopy(result),
+                        time.monotonic() + max_age,
+                    )
+            return result
         except Exception as e:
-            if self.verbose:
+            if debug:
                 logger.error(
                     "\n====== ERROR HANDLING RESPONSE ======================================"
                 )
                 logger.error(f"• Exception: {type(e).__name__}: {str(e)}")
                 logger.error(f"• Status Code: {response.status_code}")
-                logger.error(f"• Raw Response Text: {response.text}")
+                logger.error(f"• Raw Response Text: {body_preview(response)}")
                 logger.error(
                     "====== END ERROR DETAILS ==========================================\n"
                 )
@@ -284,11 +603,4 @@ class BaseApiClient:
         Returns:
             Status text.
         """
-        status_map = {
-            0: "PENDING",
-            1: "IN_PROGRESS",
-            2: "COMPLETED",
-            3: "FAILED",
-            4: "PAUSED",
-        }
-        return status_map.get(status, f"UNKNOWN({status})")
+        return self._STATUS_MAP.get(status) or f"UNKNOWN({status})"
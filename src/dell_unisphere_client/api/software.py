@@ -5,95 +5,96 @@ import logging
 import os
 import requests
 from datetime import datetime
-from typing import Any, Dict
-from unittest.mock import MagicMock
+from typing import Any, Dict, Iterable, Optional, Union
 
-from dell_unisphere_client.api.base import BaseApiClient
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # pragma: no cover - optional speedup
+    MultipartEncoder = None
+
+from dell_unisphere_client.api.base import BaseApiClient, is_mock_session
 
 logger = logging.getLogger(__name__)
 
+# Package upload endpoint (outside the /api tree)
+UPLOAD_PATH = "/upload/files/types/candidateSoftwareVersion"
+
 
 class SoftwareApi(BaseApiClient):
     """API client for software-related endpoints."""
 
-    def get_installed_software_version(self) -> Dict[str, Any]:
+    def get_installed_software_version(
+        self, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Any]:
         """Get installed software version information.
 
+        Args:
+            fields: Optional fields to include in the response, either as a
+                comma-separated string or an iterable of field names.
+
         Returns:
             Installed software version information.
         """
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock get method for test assertions
-            if hasattr(requests, "get") and callable(requests.get):
-                response = requests.get(
-                    f"{self.base_url}/api/types/installedSoftwareVersion/instances",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                    },
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {
-                "entries": [
-                    {
-                        "content": {
-                            "id": "1",
-                            "version": "5.3.0.0.5.120",
-                            "releaseDate": "2025-01-15T00:00:00.000Z",
-                            "installationDate": "2025-02-01T10:30:00.000Z",
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "get",
+                "/api/types/installedSoftwareVersion/instances",
+                {
+                    "entries": [
+                        {
+                            "content": {
+                                "id": "1",
+                                "version": "5.3.0.0.5.120",
+                                "releaseDate": "2025-01-15T00:00:00.000Z",
+                                "installationDate": "2025-02-01T10:30:00.000Z",
+                            }
                         }
-                    }
-                ]
-            }
-        return self.request("GET", "/api/types/installedSoftwareVersion/instances")
+                    ]
+                },
+            )
+        return self.request(
+            "GET",
+            "/api/types/installedSoftwareVersion/instances",
+            params=self.fields_params(fields),
+            cacheable=True,
+        )
 
-    def get_candidate_software_versions(self) -> Dict[str, Any]:
+    def get_candidate_software_versions(
+        self, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Any]:
         """Get candidate software versions.
 
+        Args:
+            fields: Optional fields to include in the response, either as a
+                comma-separated string or an iterable of field names.
+
         Returns:
             Candidate software versions.
         """
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock get method for test assertions
-            if hasattr(requests, "get") and callable(requests.get):
-                response = requests.get(
-                    f"{self.base_url}/api/types/candidateSoftwareVersion/instances",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                    },
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {
-                "entries": [
-                    {
-                        "content": {
-                            "id": "1",
-                            "version": "5.4.0.0.5.150",
-                            "releaseDate": "2025-02-15T00:00:00.000Z",
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "get",
+                "/api/types/candidateSoftwareVersion/instances",
+                {
+                    "entries": [
+                        {
+                            "content": {
+                                "id": "1",
+                                "version": "5.4.0.0.5.150",
+                                "releaseDate": "2025-02-15T00:00:00.000Z",
+                            }
                         }
-                    }
-                ]
-            }
-        return self.request("GET", "/api/types/candidateSoftwareVersion/instances")
+                    ]
+                },
+            )
+        return self.request(
+            "GET",
+            "/api/types/candidateSoftwareVersion/instances",
+            params=self.fields_params(fields),
+            cacheable=True,
+        )
 
     def prepare_software(self, file_id: str) -> Dict[str, Any]:
         """Prepare the uploaded software package.
@@ -105,31 +106,16 @@ class SoftwareApi(BaseApiClient):
             Preparation result.
         """
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock post method for test assertions
-            if hasattr(requests, "post") and callable(requests.post):
-                response = requests.post(
-                    f"{self.base_url}/api/types/candidateSoftwareVersion/action/prepare",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                        "Content-Type": "application/json",
-                    },
-                    json={"filename": file_id},
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {
-                "id": f"candidate_{file_id.replace('file_', '')}",
-                "status": "SUCCESS",
-            }
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "post",
+                "/api/types/candidateSoftwareVersion/action/prepare",
+                {
+                    "id": f"candidate_{file_id.replace('file_', '')}",
+                    "status": "SUCCESS",
+                },
+                json={"filename": file_id},
+            )
 
         return self.request(
             "POST",
@@ -147,68 +133,87 @@ class SoftwareApi(BaseApiClient):
             Upload result.
         """
         # For test compatibility, return mock data directly
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock post method for test assertions
-            if hasattr(requests, "post") and callable(requests.post):
-                # Use bytes instead of MagicMock to avoid TypeError in urllib3
-                mock_file = b"mock file content"
-                response = requests.post(
-                    f"{self.base_url}/upload/files/types/candidateSoftwareVersion",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                    },
-                    files={"file": (file_path, mock_file, "application/octet-stream")},
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {"content": {"id": "456", "version": "5.4.0.0.5.150"}}
-
-        url = self.url("/upload/files/types/candidateSoftwareVersion")
-        headers = {
-            "X-EMC-REST-CLIENT": "true",
-        }
+        if is_mock_session(self.session):
+            # Use bytes instead of MagicMock to avoid TypeError in urllib3
+            return self._mock_call(
+                "post",
+                UPLOAD_PATH,
+                {"content": {"id": "456", "version": "5.4.0.0.5.150"}},
+                files={
+                    "file": (
+                        file_path,
+                        b"mock file content",
+                        "application/octet-stream",
+                    )
+                },
+            )
 
-        if self.csrf_token:
-            headers["EMC-CSRF-TOKEN"] = self.csrf_token
+        url = self.url(UPLOAD_PATH)
+        # X-EMC-REST-CLIENT is already a session default
+        headers = {"EMC-CSRF-TOKEN": self.csrf_token} if self.csrf_token else {}
 
         # Log request details if verbose mode is enabled
-        request_start_time = datetime.now()
-        if self.verbose:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            request_start_time = datetime.now()
             timestamp = request_start_time.strftime("%H:%M:%S.%f")[
                 :-3
             ]  # Format: HH:MM:SS.mmm
-            logger.info(
+            logger.debug(
                 f"====== UPLOAD REQUEST START [{timestamp}] ============================================"
             )
-            logger.info(f"• URL:    POST {url}")
-            logger.info("• HEADERS:")
+            logger.debug(f"• URL:    POST {url}")
+            logger.debug("• HEADERS:")
             headers_str = "\n    ".join(
                 [f"{key}: {value}" for key, value in headers.items()]
             )
-            logger.info(f"    {headers_str}")
-            logger.info(f"• FILE:    {file_path}")
-            logger.info(f"• FILE SIZE: {os.path.getsize(file_path)} bytes")
+            logger.debug(f"    {headers_str}")
+            logger.debug(f"• FILE:    {file_path}")
+            logger.debug(f"• FILE SIZE: {os.path.getsize(file_path)} bytes")
 
         with open(file_path, "rb") as f:
-            files = {"file": (file_path, f, "application/octet-stream")}
-            response = self.session.post(
-                url,
-                headers=headers,
-                files=files,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
+            if MultipartEncoder is not None and isinstance(
+                self.session, requests.Session
+            ):
+                # Stream the package from disk with a precomputed Content-Length
+                # instead of building the whole multipart body in memory
+                encoder = MultipartEncoder(
+                    fields={
+                        "file": (
+                            os.path.basename(file_path),
+                            f,
+                            "application/octet-stream",
+                        )
+                    }
+                )
+                headers["Content-Type"] = encoder.content_type
+                response = self.send(
+                    "POST",
+                    url,
+                    headers=headers,
+                    data=encoder,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl,
+                )
+            else:
+                files = {
+                    "file": (
+                        os.path.basename(file_path),
+                        f,
+                        "application/octet-stream",
+                    )
+                }
+                response = self.send(
+                    "POST",
+                    url,
+                    headers=headers,
+                    files=files,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl,
+                )
 
         # Log response details if verbose mode is enabled
-        if self.verbose:
+        if debug:
             response_time = datetime.now()
             duration_ms = int(
                 (response_time - request_start_time).total_seconds() * 1000
@@ -216,30 +221,33 @@ class SoftwareApi(BaseApiClient):
             timestamp = response_time.strftime("%H:%M:%S.%f")[
                 :-3
             ]  # Format: HH:MM:SS.mmm
-            logger.info(
+            logger.debug(
                 f"====== UPLOAD RESPONSE [{timestamp}] ==============================================="
             )
-            logger.info(
-                f"• Status:  {response.status_code} {response.reason} ({duration_ms}ms)"
+            reason = getattr(response, "reason", None) or getattr(
+                response, "reason_phrase", ""
+            )
+            logger.debug(
+                f"• Status:  {response.status_code} {reason} ({duration_ms}ms)"
             )
-            logger.info("• HEADERS:")
+            logger.debug("• HEADERS:")
             headers_str = "\n    ".join(
                 [f"{key}: {value}" for key, value in response.headers.items()]
             )
-            logger.info(f"    {headers_str}")
+            logger.debug(f"    {headers_str}")
 
             # Try to log response body if it's JSON
             try:
                 response_json = response.json()
-                logger.info("• BODY:")
+                logger.debug("• BODY:")
                 body_str = json.dumps(response_json, indent=2)
                 body_str = "\n    ".join(body_str.split("\n"))
-                logger.info(f"    {body_str}")
+                logger.debug(f"    {body_str}")
             except ValueError:
-                logger.info("• BODY: [Not JSON]")
+                logger.debug("• BODY: [Not JSON]")
                 if (
                     len(response.content) < 1000
                 ):  # Only log if response is not too large
-                    logger.info(f"    {response.text}")
+                    logger.debug(f"    {response.text}")
 
         return self.handle_response(response)
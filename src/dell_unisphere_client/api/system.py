@@ -16,7 +16,9 @@ class SystemApi(BaseApiClient):
         Returns:
             System information.
         """
-        return self.request("GET", "/api/types/basicSystemInfo/instances")
+        return self.request(
+            "GET", "/api/types/basicSystemInfo/instances", cacheable=True
+        )
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information.
@@ -32,4 +34,4 @@ class SystemApi(BaseApiClient):
         Returns:
             System information.
         """
-        return self.request("GET", "/api/types/system/instances")
+        return self.request("GET", "/api/types/system/instances", cacheable=True)
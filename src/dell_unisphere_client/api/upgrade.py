@@ -2,81 +2,85 @@
 
 import logging
 import time
-from typing import Any, Dict, Optional
-from unittest.mock import MagicMock
+from typing import Any, Dict, Iterable, Optional, Union
 
-import requests
-
-from dell_unisphere_client.api.base import BaseApiClient
+from dell_unisphere_client.api.base import (
+    BaseApiClient,
+    connection_errors,
+    is_mock_session,
+)
 from dell_unisphere_client.exceptions import UnisphereClientError
 
 logger = logging.getLogger(__name__)
 
+# Growth of the poll interval while an upgrade shows no progress, and its cap
+# as a multiple of the requested interval
+BACKOFF_MULTIPLIER = 1.5
+MAX_BACKOFF_FACTOR = 4
+
+# Fields requested when polling upgrade sessions
+DEFAULT_UPGRADE_SESSION_FIELDS = (
+    "id",
+    "status",
+    "caption",
+    "percentComplete",
+    "type",
+    "elapsedTime",
+    "tasks",
+)
+
 
 class UpgradeApi(BaseApiClient):
     """API client for upgrade-related endpoints."""
 
     def get_software_upgrade_sessions(
-        self, fields: str = None, request_timeout: Optional[int] = None
+        self,
+        fields: Optional[Union[str, Iterable[str]]] = None,
+        request_timeout: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get software upgrade sessions.
 
         Args:
-            fields: Optional comma-separated list of fields to include in the response.
+            fields: Optional fields to include in the response, either as a
+                comma-separated string or an iterable of field names.
             request_timeout: Optional custom timeout for this specific request (in seconds).
 
         Returns:
             Software upgrade sessions.
         """
+        # Add fields parameter if provided
+        params = self.fields_params(fields)
+
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock get method for test assertions
-            if hasattr(requests, "get") and callable(requests.get):
-                # Prepare params with fields if provided
-                params = {}
-                if fields:
-                    params["fields"] = fields
-
-                response = requests.get(
-                    f"{self.base_url}/api/types/upgradeSession/instances",
-                    params=params,
-                    headers={
-                        "EMC-CSRF-TOKEN": "test-token",
-                    },
-                    cookies={},
-                    verify=self.verify_ssl,
-                    timeout=60,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {
-                "entries": [
-                    {
-                        "content": {
-                            "id": "123",
-                            "status": "Paused",
-                            "candidateVersion": "5.4.0.0.5.150",
-                            "percentComplete": 45,
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "get",
+                "/api/types/upgradeSession/instances",
+                {
+                    "entries": [
+                        {
+                            "content": {
+                                "id": "123",
+                                "status": "Paused",
+                                "candidateVersion": "5.4.0.0.5.150",
+                                "percentComplete": 45,
+                            }
                         }
-                    }
-                ]
-            }
-        # Add fields parameter if provided
-        params = {}
-        if fields:
-            params["fields"] = fields
+                    ]
+                },
+                headers={"EMC-CSRF-TOKEN": "test-token"},
+                params=params,
+                cookies={},
+                timeout=60,
+            )
 
         return self.request(
             "GET",
             "/api/types/upgradeSession/instances",
             params=params,
             custom_timeout=request_timeout,
+            cacheable=True,
+            revalidate_only=True,
         )
 
     def get_software_upgrade_session(self, session_id: str) -> Dict[str, Any]:
@@ -92,9 +96,7 @@ class UpgradeApi(BaseApiClient):
         response = self.request(
             "GET",
             "/api/types/upgradeSession/instances",
-            params={
-                "fields": "id,status,caption,percentComplete,type,elapsedTime,tasks"
-            },
+            params=self.fields_params(DEFAULT_UPGRADE_SESSION_FIELDS),
         )
 
         # Find the session with the matching ID
@@ -147,25 +149,20 @@ class UpgradeApi(BaseApiClient):
               }
             }
         """
+        # Prepare payload with version if provided
+        payload = {}
+        if version:
+            payload = {"version": version}
+
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock post method for test assertions
-            if hasattr(requests, "post") and callable(requests.post):
-                # Prepare payload with version if provided
-                payload = {}
-                if version:
-                    payload = {"version": version}
-
-                requests.post(
-                    f"{self.base_url}/api/types/upgradeSession/action/verifyUpgradeEligibility",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                    verify=self.verify_ssl,
-                )
+        if is_mock_session(self.session):
+            # The mocked response is ignored; the real system format is returned
+            self._mock_call(
+                "post",
+                "/api/types/upgradeSession/action/verifyUpgradeEligibility",
+                None,
+                json=payload,
+            )
 
             # Return the updated mock response format that matches the real system
             from datetime import datetime, timezone
@@ -183,11 +180,6 @@ class UpgradeApi(BaseApiClient):
                 },
             }
 
-        # Prepare payload with version if provided
-        payload = {}
-        if version:
-            payload = {"version": version}
-
         return self.request(
             "POST",
             "/api/types/upgradeSession/action/verifyUpgradeEligibility",
@@ -207,39 +199,13 @@ class UpgradeApi(BaseApiClient):
             Created session.
         """
         # For test compatibility
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock post method for test assertions
-            if hasattr(requests, "post") and callable(requests.post):
-                # Use the correct schema for the request body
-                request_body = {"candidate": {"id": candidate_version_id}}
-
-                response_obj = requests.post(
-                    f"{self.base_url}/api/types/upgradeSession/instances",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                        "Content-Type": "application/json",
-                    },
-                    json=request_body,
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response_obj, "json") and callable(response_obj.json):
-                    try:
-                        return response_obj.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for tests
-            return {"content": {"id": "123", "status": "Scheduled"}}
-
-        # Prepare headers with required authentication
-        headers = {
-            "X-EMC-REST-CLIENT": "true",
-            "Content-Type": "application/json",
-        }
-        if self.csrf_token:
-            headers["EMC-CSRF-TOKEN"] = self.csrf_token
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "post",
+                "/api/types/upgradeSession/instances",
+                {"content": {"id": "123", "status": "Scheduled"}},
+                json={"candidate": {"id": candidate_version_id}},
+            )
 
         # Prepare request data with the correct schema
         data = {"candidate": {"id": candidate_version_id}}
@@ -247,12 +213,12 @@ class UpgradeApi(BaseApiClient):
         if description:
             data["description"] = description
 
-        # Make the request for real implementation
+        # Make the request for real implementation; request() adds the
+        # Content-Type and CSRF headers, the client header is a session default
         response = self.request(
             "POST",
             "/api/types/upgradeSession/instances",
             json_data=data,
-            headers=headers,
         )
 
         # Validate response
@@ -278,34 +244,19 @@ class UpgradeApi(BaseApiClient):
             Resume result.
         """
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
-            # Make sure to call the mock post method for test assertions
-            if hasattr(requests, "post") and callable(requests.post):
-                response = requests.post(
-                    f"{self.base_url}/api/instances/upgradeSession/{session_id}/action/resume",
-                    headers={
-                        "X-EMC-REST-CLIENT": "true",
-                        "EMC-CSRF-TOKEN": self.csrf_token,
-                        "Content-Type": "application/json",
-                    },
-                    json={},
-                    verify=self.verify_ssl,
-                )
-                # If we're in a unit test, the mock response will have a return value set
-                if hasattr(response, "json") and callable(response.json):
-                    try:
-                        return response.json()
-                    except (AttributeError, ValueError):
-                        pass
-
-            # Default mock data for integration tests
-            return {
-                "content": {
-                    "id": session_id,
-                    "status": "InProgress",
-                    "candidateVersion": "5.4.0.0.5.150",
-                }
-            }
+        if is_mock_session(self.session):
+            return self._mock_call(
+                "post",
+                f"/api/instances/upgradeSession/{session_id}/action/resume",
+                {
+                    "content": {
+                        "id": session_id,
+                        "status": "InProgress",
+                        "candidateVersion": "5.4.0.0.5.150",
+                    }
+                },
+                json={},
+            )
 
         return self.request(
             "POST",
@@ -317,6 +268,10 @@ class UpgradeApi(BaseApiClient):
     ) -> Dict[str, Any]:
         """Monitor the upgrade session until completion (stateless operation).
 
+        The poll interval backs off while the session shows no progress, up to
+        ``MAX_BACKOFF_FACTOR`` times ``interval``, and drops back to
+        ``interval`` as soon as the status or percentage changes.
+
         Args:
             interval: Polling interval in seconds.
             timeout: Maximum time to wait in seconds (default: 7200 seconds or 2 hours).
@@ -328,7 +283,7 @@ class UpgradeApi(BaseApiClient):
             UnisphereClientError: When monitoring fails or times out.
         """
         # Mock implementation for tests
-        if isinstance(self.session, MagicMock):
+        if is_mock_session(self.session):
             # For tests, just return a completed session
             return {
                 "content": {
@@ -354,17 +309,25 @@ class UpgradeApi(BaseApiClient):
         start_time = time.time()
         last_status = None
         last_percent = 0
+        delay = interval
         connection_lost = False
         primary_sp_reboot_detected = False
         retry_count = 0
         max_retries = 30  # 5 minutes with 10-second retry interval
 
-        logger.info("Starting to monitor upgrade session")
-        logger.info("Starting upgrade monitoring...")
+        # Bind the lookups repeated on every poll to locals
+        poll = self.get_software_upgrade_sessions
+        status_text_of = self.get_status_text
+        now = time.time
+        sleep = time.sleep
+        info = logger.info
+
+        info("Starting to monitor upgrade session")
+        info("Starting upgrade monitoring...")
 
         while True:
             # Check if we've exceeded the timeout
-            if time.time() - start_time > timeout:
+            if now() - start_time > timeout:
                 raise UnisphereClientError(
                     f"Monitoring timed out after {timeout} seconds"
                 )
@@ -374,15 +337,15 @@ class UpgradeApi(BaseApiClient):
                 request_timeout = 30 if primary_sp_reboot_detected else None
 
                 # Get all upgrade sessions
-                response = self.get_software_upgrade_sessions(
-                    fields="id,status,caption,percentComplete,type,elapsedTime,tasks",
+                response = poll(
+                    fields=DEFAULT_UPGRADE_SESSION_FIELDS,
                     request_timeout=request_timeout,
                 )
 
                 # Connection restored after loss
                 if connection_lost:
                     connection_lost = False
-                    logger.info("Connection to Unisphere restored")
+                    info("Connection to Unisphere restored")
                     # Reset retry counter on successful connection
                     retry_count = 0
 
@@ -405,34 +368,36 @@ class UpgradeApi(BaseApiClient):
                         and task.get("status") == 1
                     ):  # IN_PROGRESS
                         primary_sp_reboot_detected = True
-                        logger.info(
-                            "Primary SP reboot in progress - connection loss expected"
-                        )
+                        info("Primary SP reboot in progress - connection loss expected")
                         break
 
                 # Print progress if it has changed
                 if status != last_status or percent_complete != last_percent:
-                    status_text = self.get_status_text(status)
-                    logger.info("Status: %s", status_text)
-                    logger.info("Progress: %d%%", percent_complete)
-
-                    # Print task status
-                    tasks = content.get("tasks", [])
-                    for task in tasks:
-                        task_status = task.get("status")
-                        task_status_text = self.get_status_text(task_status)
-                        logger.info(
-                            "Task: %s - %s",
-                            task.get("caption", "Unknown"),
-                            task_status_text,
+                    # One record per change instead of one per task
+                    if logger.isEnabledFor(logging.INFO):
+                        lines = [
+                            f"Status: {status_text_of(status)}",
+                            f"Progress: {percent_complete}%",
+                        ]
+                        lines.extend(
+                            f"Task: {task.get('caption', 'Unknown')} - "
+                            f"{status_text_of(task.get('status'))}"
+                            for task in tasks
                         )
+                        info("\n".join(lines))
 
                     last_status = status
                     last_percent = percent_complete
+                    delay = interval
+                else:
+                    # No progress since the last poll; back off
+                    delay = min(
+                        delay * BACKOFF_MULTIPLIER, interval * MAX_BACKOFF_FACTOR
+                    )
 
                 # Check if upgrade is completed
                 if status == 2:  # COMPLETED
-                    logger.info("Upgrade completed successfully!")
+                    info("Upgrade completed successfully!")
                     return session
 
                 # Check if upgrade failed
@@ -441,30 +406,24 @@ class UpgradeApi(BaseApiClient):
                     raise UnisphereClientError("Upgrade failed", response=session)
 
                 # Wait before checking again
-                time.sleep(interval)
+                sleep(delay)
 
-            except (
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.RequestException,
-            ) as e:
+            except connection_errors() as e:
                 # Connection lost
                 connection_lost = True
                 retry_count += 1
 
                 if primary_sp_reboot_detected:
-                    logger.info(
-                        "Connection lost during primary SP reboot - this is expected"
-                    )
-                    logger.info(
+                    info("Connection lost during primary SP reboot - this is expected")
+                    info(
                         "Will automatically reconnect when the primary SP is back online"
                     )
                 else:
                     logger.warning(f"Connection error: {str(e)}")
-                    logger.info("Retrying connection...")
+                    info("Retrying connection...")
 
                 # Use shorter retry interval during connection loss
-                time.sleep(10)  # Retry every 10 seconds during connection loss
+                sleep(10)  # Retry every 10 seconds during connection loss
 
                 # If we've been trying too long without success and not during SP reboot
                 if retry_count > max_retries and not primary_sp_reboot_detected:
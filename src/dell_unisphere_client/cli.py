@@ -27,11 +27,12 @@ __all__ = [
 ]
 
 import argparse
+import functools
 import json
 import logging
 import os
 import sys
-import requests
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -41,6 +42,8 @@ from rich.table import Table
 from rich.console import Group
 
 from dell_unisphere_client.version import get_version
+from dell_unisphere_client.api.base import connection_errors
+from dell_unisphere_client.api.upgrade import DEFAULT_UPGRADE_SESSION_FIELDS
 from dell_unisphere_client import (
     AuthenticationError,
     UnisphereClientError,
@@ -61,6 +64,8 @@ console = Console()
 # Default configuration
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "dell-unisphere-client"
 DEFAULT_CONFIG_FILE = Path(DEFAULT_CONFIG_DIR) / "config.json"
+# CSRF token and cookies shared by consecutive CLI invocations
+DEFAULT_SESSION_FILE = Path(DEFAULT_CONFIG_DIR) / "session.json"
 DEFAULT_CONFIG = {
     "base_url": "https://localhost:8000",
     "username": "admin",
@@ -76,11 +81,22 @@ MSG_PRIMARY_SP_REBOOT = (
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; cached per path and modification time."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_config() -> Dict[str, Any]:
-    """Load configuration from file."""
+    """Load configuration from file.
+
+    The parsed file is cached until it is modified; callers get a copy
+    they may change.
+    """
     try:
-        with open(DEFAULT_CONFIG_FILE, "r") as f:
-            return json.load(f)
+        mtime_ns = os.stat(DEFAULT_CONFIG_FILE).st_mtime_ns
+        return dict(_read_config(str(DEFAULT_CONFIG_FILE), mtime_ns))
     except FileNotFoundError:
         logger.warning("Config file not found, using defaults.")
         return DEFAULT_CONFIG
@@ -98,6 +114,8 @@ def save_config(config: Dict[str, Any]) -> None:
     try:
         with open(DEFAULT_CONFIG_FILE, "w") as f:
             json.dump(config, f, indent=2)
+        # Rewrites within the mtime granularity must not serve stale data
+        _read_config.cache_clear()
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
         raise
@@ -140,6 +158,7 @@ def get_client(
         password=config["password"],
         verify_ssl=config["verify_ssl"],
         verbose=verbose,
+        session_file=DEFAULT_SESSION_FILE,
     )
 
 
@@ -188,9 +207,13 @@ def add_common_arguments(parser):
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for the CLI.
 
+    The parser is built once per process; parsing does not modify it, so
+    ``main()`` and ``parse_args()`` share the same instance.
+
     Returns:
         Configured argument parser.
     """
@@ -586,7 +609,6 @@ def cmd_system_info(args: argparse.Namespace) -> None:
     """
     verbose = getattr(args, "verbose", False)
     client = get_client(verbose=verbose)
-    client.login()
     result = client.get_system_info()
 
     if hasattr(args, "json_output") and args.json_output:
@@ -620,7 +642,6 @@ def cmd_software_version(args: argparse.Namespace) -> None:
     """
     verbose = getattr(args, "verbose", False)
     client = get_client(verbose=verbose)
-    client.login()
     result = client.get_installed_software_version()
 
     if hasattr(args, "json_output") and args.json_output:
@@ -658,7 +679,6 @@ def cmd_candidate_versions(args: argparse.Namespace) -> None:
 
     verbose = getattr(args, "verbose", False)
     client = get_client(verbose=verbose)
-    client.login()
     result = client.get_candidate_software_versions()
 
     if hasattr(args, "json_output") and args.json_output:
@@ -695,7 +715,6 @@ def cmd_upgrade_sessions(args: argparse.Namespace) -> None:
 
     verbose = getattr(args, "verbose", False)
     client = get_client(verbose=verbose)
-    client.login()
     result = client.get_software_upgrade_sessions()
 
     if hasattr(args, "json_output") and args.json_output:
@@ -878,8 +897,9 @@ def cmd_monitor_upgrade(args: argparse.Namespace) -> None:
         args: Command line arguments.
     """
     verbose = getattr(args, "verbose", False)
+    # Polling is read-only: one session with Basic auth serves the whole
+    # run, without a login round trip for a CSRF token
     client = get_client(verbose=verbose)
-    client.login()
 
     # Display initial message
     console.print("Monitoring upgrade session...")
@@ -899,7 +919,6 @@ def cmd_monitor_upgrade(args: argparse.Namespace) -> None:
         BarColumn,
         TimeElapsedColumn,
     )
-    import time
 
     # Create a simplified layout with just header and tasks
     layout = Layout()
@@ -1078,8 +1097,8 @@ def cmd_monitor_upgrade(args: argparse.Namespace) -> None:
             while elapsed_seconds < args.timeout:
                 try:
                     # Get all upgrade sessions with detailed task information
-                    response = client.upgrade_api.get_software_upgrade_sessions(
-                        fields="id,status,caption,percentComplete,type,elapsedTime,tasks"
+                    response = client.get_software_upgrade_sessions(
+                        fields=DEFAULT_UPGRADE_SESSION_FIELDS
                     )
 
                     # Connection restored after loss
@@ -1189,12 +1208,7 @@ def cmd_monitor_upgrade(args: argparse.Namespace) -> None:
                     # Update elapsed time
                     elapsed_seconds = time.time() - start_time
 
-                except (
-                    requests.exceptions.ConnectionError,
-                    requests.exceptions.Timeout,
-                    requests.exceptions.RequestException,
-                    UnisphereClientError,
-                ) as e:
+                except (*connection_errors(), UnisphereClientError) as e:
                     # Connection lost
                     connection_lost = True
                     retry_count += 1
@@ -3,25 +3,57 @@
 This module provides a client for interacting with the Dell Unisphere REST API.
 """
 
+import base64
+import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+import os
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util import Retry
 
 from dell_unisphere_client.api import SystemApi, SoftwareApi, UpgradeApi
-from dell_unisphere_client.exceptions import AuthenticationError
+from dell_unisphere_client.api.base import (
+    DEFAULT_HEADERS,
+    connection_errors,
+    dumps_json,
+    enable_verbose_logging,
+    loads_json,
+    send_request,
+)
+from dell_unisphere_client.exceptions import AuthenticationError, UnisphereClientError
 
 logger = logging.getLogger(__name__)
 
 urllib3.disable_warnings(InsecureRequestWarning)
 
+# Upper bound in seconds on the best-effort logout request
+LOGOUT_TIMEOUT = 2
+
+# Seconds a login (and its CSRF token) is reused before logging in again;
+# kept under an hour so the token is refreshed before the array expires it
+AUTH_TTL = 3300
+
+# Connection pool sizing for the requests transport
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
 
 class UnisphereClient:
     """Client for interacting with Dell Unisphere REST API."""
 
+    # Connection pools shared by every requests session against the same
+    # endpoint; an adapter is dropped once no live session mounts it
+    _adapter_cache: "weakref.WeakValueDictionary[Tuple[str, bool], HTTPAdapter]" = (
+        weakref.WeakValueDictionary()
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -30,6 +62,9 @@ class UnisphereClient:
         verify_ssl: bool = True,
         timeout: int = 600,
         verbose: bool = False,
+        transport: str = "requests",
+        auth_ttl: int = AUTH_TTL,
+        session_file: Optional[str] = None,
     ):
         """Initialize the client.
 
@@ -39,48 +74,76 @@ class UnisphereClient:
             password: Password for authentication.
             verify_ssl: Whether to verify SSL certificates.
             timeout: Request timeout in seconds.
-            verbose: Whether to print detailed request and response information.
+            verbose: Whether to log detailed request and response information;
+                raises the package logger to DEBUG.
+            transport: HTTP backend, either "requests" or "httpx". The httpx
+                backend multiplexes requests over a single HTTP/2 connection
+                and requires the "http2" extra.
+            auth_ttl: Seconds a login is reused by mutating calls before the
+                client logs in again for a fresh CSRF token.
+            session_file: Optional path where the CSRF token and session
+                cookies are saved after login, so later processes can reuse
+                them within ``auth_ttl`` instead of logging in again.
         """
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+
         self.base_url = base_url
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
         self.timeout = timeout
-        self.verbose = verbose
+        if verbose:
+            enable_verbose_logging()
+        self.transport = transport
+        self.auth_ttl = auth_ttl
 
-        # No session manager in stateless mode
+        # Pre-encode the Basic credentials once instead of on every request
+        credentials = f"{username}:{password}".encode("utf-8")
+        self._auth_header = f"Basic {base64.b64encode(credentials).decode('ascii')}"
+
+        # Session endpoints used by every login/logout cycle
+        self._login_url = f"{base_url}/api/types/loginSessionInfo/instances"
+        self._logout_url = f"{base_url}/api/types/loginSessionInfo/action/logout"
 
         # Initialize API clients
         self.session = None
         self.csrf_token = None
         self._logged_in = False
-        self._session_file = None
+        self._login_time = 0.0
+        self._session_restored = False
+        self._session_file = str(session_file) if session_file else None
 
         # These will be initialized after login
         self.system_api = None
         self.software_api = None
         self.upgrade_api = None
 
-    def _load_session(self) -> Dict:
+    def _load_session(self) -> Optional[Dict[str, Any]]:
         """Load session data from the session file.
 
-        This method is kept for backwards compatibility with tests.
-        In the stateless approach, it always returns None.
-
         Returns:
-            Dictionary containing session data or None
+            Dictionary containing session data, or None without a session
+            file.
 
         Raises:
             ValueError: If session file is corrupted or invalid
         """
-        # No session management in stateless mode
-        return None
+        if not self._session_file:
+            return None
+        try:
+            with open(self._session_file, "rb") as f:
+                session_data = loads_json(f.read())
+        except FileNotFoundError:
+            return None
+        if not isinstance(session_data, dict):
+            raise ValueError(f"Invalid session file: {self._session_file}")
+        return session_data
 
     def _is_session_expired(self, session_data: dict) -> bool:
         """Check if the session has expired.
 
-        This method is kept for backwards compatibility with tests.
-        In the stateless approach, it always returns True.
+        Saved sessions share the ``auth_ttl`` of in-process logins.
 
         Args:
             session_data: Dictionary containing session information
@@ -88,32 +151,93 @@ class UnisphereClient:
         Returns:
             True if session is expired, False otherwise
         """
-        # In stateless mode, sessions are always considered expired
-        return True
+        created = session_data.get("creation_timestamp")
+        if not isinstance(created, (int, float)):
+            return True
+        return time.time() - created >= self.auth_ttl
 
-    def _should_reuse_session(self) -> bool:
-        """Determine if an existing session should be reused.
+    def _should_reuse_session(self, session_data: Optional[dict]) -> bool:
+        """Determine if a saved session should be reused.
 
-        This method is kept for backwards compatibility with tests.
-        In the stateless approach, it always returns False.
+        Args:
+            session_data: Dictionary containing session information
+
+        Returns:
+            True if the session belongs to this URL and credentials and is
+            still valid.
+        """
+        return bool(
+            session_data
+            and session_data.get("base_url") == self.base_url
+            and session_data.get("username") == self.username
+            and session_data.get("auth_hash") == self._auth_hash()
+            and session_data.get("csrf_token")
+            and not self._is_session_expired(session_data)
+        )
+
+    def _auth_hash(self) -> str:
+        """Return a digest of the credentials, stored with saved sessions.
 
         Returns:
-            False in stateless mode
+            Hex SHA-256 digest of the Authorization header.
         """
-        # In stateless mode, sessions are never reused
-        return False
+        return hashlib.sha256(self._auth_header.encode("utf-8")).hexdigest()
 
     def _create_session_file(self, session_data: dict) -> None:
         """Create a session file with the given session data.
 
-        This method is kept for backwards compatibility with tests.
-        In the stateless approach, it does nothing.
+        The file holds the CSRF token and session cookies, so it is only
+        readable by the current user. It is written to a temporary file
+        and renamed into place, so readers never see a partial file.
 
         Args:
             session_data: Dictionary containing session information
         """
-        # No-op in stateless mode
-        pass
+        if not self._session_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._session_file) or ".", exist_ok=True)
+            tmp_file = f"{self._session_file}.{os.getpid()}.tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dumps_json(session_data))
+                os.replace(tmp_file, self._session_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
+        except OSError as e:
+            logger.warning("Failed to save session file: %s", e)
+
+    def _remove_session_file(self) -> None:
+        """Remove the session file, if any."""
+        if not self._session_file:
+            return
+        try:
+            os.remove(self._session_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Failed to remove session file: %s", e)
+
+    def _restore_session(self, session_data: dict) -> None:
+        """Rebuild the logged-in state from saved session data.
+
+        Args:
+            session_data: Dictionary containing session information
+        """
+        if self.session is not None:
+            self._close_session(self.session)
+        self.session = self._create_session()
+        self.session.cookies.update(session_data.get("cookies") or {})
+        self.csrf_token = session_data["csrf_token"]
+        self.session.headers["EMC-CSRF-TOKEN"] = self.csrf_token
+        self._logged_in = True
+        self._session_restored = True
+        # Count the TTL from the original login, not from this process
+        age = max(0.0, time.time() - session_data["creation_timestamp"])
+        self._login_time = time.monotonic() - age
+        self._initialize_api_clients()
 
     def login(self) -> bool:
         """Login to the Unisphere API.
@@ -125,15 +249,17 @@ class UnisphereClient:
             AuthenticationError: When authentication fails.
         """
         try:
-            # Create a new session for each login (stateless approach)
-            self.session = requests.Session()
-            self.session.verify = self.verify_ssl
-            self.session.auth = (self.username, self.password)
+            # Create a new session for each login (stateless approach),
+            # releasing the one from the previous login
+            if self.session is not None:
+                self._close_session(self.session)
+            self.session = self._create_session()
 
             # Make a GET request to obtain a CSRF token
-            response = self.session.get(
-                f"{self.base_url}/api/types/loginSessionInfo/instances",
-                headers={"X-EMC-REST-CLIENT": "true"},
+            response = send_request(
+                self.session,
+                "GET",
+                self._login_url,
                 verify=self.verify_ssl,
             )
 
@@ -148,131 +274,241 @@ class UnisphereClient:
             if "EMC-CSRF-TOKEN" in response.headers:
                 self.csrf_token = response.headers["EMC-CSRF-TOKEN"]
                 # Update session with CSRF token
-                self.session.headers.update(
-                    {"EMC-CSRF-TOKEN": self.csrf_token, "X-EMC-REST-CLIENT": "true"}
-                )
-
-            # Store session in session manager for current operation
-            # No session manager in stateless mode
+                self.session.headers["EMC-CSRF-TOKEN"] = self.csrf_token
 
             self._logged_in = True
+            self._session_restored = False
+            self._login_time = time.monotonic()
             self._initialize_api_clients()
+
+            # Save the token and cookies for later processes
+            if self._session_file and self.csrf_token:
+                now = int(time.time())
+                self._create_session_file(
+                    {
+                        "base_url": self.base_url,
+                        "username": self.username,
+                        "auth_hash": self._auth_hash(),
+                        "csrf_token": self.csrf_token,
+                        "cookies": dict(self.session.cookies),
+                        "creation_timestamp": now,
+                        "last_access_timestamp": now,
+                    }
+                )
             return True
-        except Exception as e:
+        except AuthenticationError:
+            raise
+        except connection_errors() as e:
             self.session = None
-            raise AuthenticationError(f"Login failed: {str(e)}")
+            raise AuthenticationError(f"Login failed: {e}") from e
 
-    def _initialize_api_clients(self):
-        """Initialize API clients with the current session."""
-        self.system_api = SystemApi(
-            base_url=self.base_url,
-            session=self.session,
-            csrf_token=self.csrf_token,
-            verify_ssl=self.verify_ssl,
-            timeout=self.timeout,
-            verbose=self.verbose,
-        )
+    def _create_session(self) -> requests.Session:
+        """Create a session carrying the Basic credentials.
 
-        self.software_api = SoftwareApi(
-            base_url=self.base_url,
-            session=self.session,
-            csrf_token=self.csrf_token,
-            verify_ssl=self.verify_ssl,
-            timeout=self.timeout,
-            verbose=self.verbose,
-        )
+        Returns:
+            New ``requests.Session``, or ``httpx.Client`` for the httpx transport.
 
-        self.upgrade_api = UpgradeApi(
-            base_url=self.base_url,
-            session=self.session,
-            csrf_token=self.csrf_token,
-            verify_ssl=self.verify_ssl,
-            timeout=self.timeout,
-            verbose=self.verbose,
-        )
+        Raises:
+            UnisphereClientError: When the httpx transport is not installed.
+        """
+        if self.transport == "httpx":
+            try:
+                import httpx
+            except ImportError as e:
+                raise UnisphereClientError(
+                    "The httpx transport requires the 'http2' extra"
+                ) from e
+
+            return httpx.Client(
+                http2=True,
+                verify=self.verify_ssl,
+                timeout=self.timeout,
+                headers={**DEFAULT_HEADERS, "Authorization": self._auth_header},
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+
+        session = requests.Session()
+        adapter = self._get_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.verify_ssl
+        session.headers.update(DEFAULT_HEADERS)
+        session.headers["Authorization"] = self._auth_header
+        return session
+
+    def _close_session(self, session: Any) -> None:
+        """Release a session that is no longer used by this client.
+
+        The pooled adapter of a requests session is detached first, as its
+        keep-alive connections are shared by every client for the same
+        endpoint.
+
+        Args:
+            session: Session to close.
+        """
+        try:
+            adapters = getattr(session, "adapters", None)
+            if isinstance(adapters, dict):
+                adapters.clear()
+            session.close()
+        except Exception as e:
+            logger.debug("Closing session failed: %s", e)
+
+    def _get_adapter(self) -> HTTPAdapter:
+        """Return the connection pool adapter for this client's endpoint.
+
+        Credentials and cookies stay on each session, so clients against the
+        same Unisphere can safely share keep-alive connections.
+
+        Returns:
+            Pooled adapter with retries for idempotent methods.
+        """
+        key = (self.base_url, self.verify_ssl)
+        adapter = self._adapter_cache.get(key)
+        if adapter is None:
+            # Keep connections alive across polls and retry transient gateway
+            # errors; only idempotent methods are retried after a response
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset({"GET", "DELETE"}),
+                    raise_on_status=False,
+                ),
+            )
+            self._adapter_cache[key] = adapter
+        return adapter
+
+    def _initialize_api_clients(self):
+        """Initialize API clients with the current session.
+
+        After a re-login the existing API clients are rebound to the new
+        session and token instead of being rebuilt, which keeps their URL
+        caches and shared ETag cache.
+        """
+        context = {
+            "session": self.session,
+            "csrf_token": self.csrf_token,
+            "verify_ssl": self.verify_ssl,
+            "timeout": self.timeout,
+        }
+        if self.system_api is None:
+            # One response cache for all three, so that a POST through any
+            # of them invalidates responses cached by the others
+            context["response_cache"] = {}
+            self.system_api = SystemApi(base_url=self.base_url, **context)
+            self.software_api = SoftwareApi(base_url=self.base_url, **context)
+            self.upgrade_api = UpgradeApi(base_url=self.base_url, **context)
+            return
+
+        for api in (self.system_api, self.software_api, self.upgrade_api):
+            for name, value in context.items():
+                setattr(api, name, value)
 
     def logout(self) -> bool:
         """Logout from the Unisphere API.
 
+        The logout request is best-effort and uses a short timeout so that
+        leaving the context manager does not block on a slow array.
+
         Returns:
             True if logout was successful.
         """
-        # For test compatibility, check if session exists even if not logged in
-        if not self._logged_in and not self.session:
+        # End a login saved by an earlier process, e.g. a separate CLI run
+        if not self.session and self._session_file:
+            try:
+                session_data = self._load_session()
+            except ValueError:
+                session_data = None
+            if self._should_reuse_session(session_data):
+                self._restore_session(session_data)
+            self._remove_session_file()
+
+        # Nothing to close without a session
+        if not self.session:
+            self._logged_in = False
             return True
 
         try:
-            # Make a POST request to logout
-            headers = {
-                "X-EMC-REST-CLIENT": "true",
-            }
-            if self.csrf_token:
-                headers["EMC-CSRF-TOKEN"] = self.csrf_token
-
-            requests.post(
-                f"{self.base_url}/api/types/loginSessionInfo/action/logout",
+            # Make a POST request to logout; X-EMC-REST-CLIENT is a session default
+            headers = {"EMC-CSRF-TOKEN": self.csrf_token} if self.csrf_token else {}
+
+            # Reuse the session's pooled connection instead of opening a new one
+            send_request(
+                self.session,
+                "POST",
+                self._logout_url,
                 headers=headers,
                 verify=self.verify_ssl,
+                timeout=min(self.timeout, LOGOUT_TIMEOUT),
             )
-
-            # Reset session state
-            self._logged_in = False
-            self.csrf_token = None
-            self.session = None
-            self.system_api = None
-            self.software_api = None
-            self.upgrade_api = None
-            return True
         except Exception as e:
             logger.error("Logout failed: %s", str(e))
-            return True  # Return True anyway to match test expectations
+
+        # Reset session state even if the server could not be reached
+        self._remove_session_file()
+        self._close_session(self.session)
+        self._logged_in = False
+        self.csrf_token = None
+        self.session = None
+        self.system_api = None
+        self.software_api = None
+        self.upgrade_api = None
+        return True  # Return True anyway to match test expectations
 
     # System API methods
     def get_basic_system_info(self) -> Dict[str, Any]:
         """Get basic system information."""
-        # self._ensure_logged_in()
+        self._ensure_session()
         return self.system_api.get_basic_system_info()
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information."""
-        self._ensure_logged_in()
+        self._ensure_session()
         return self.system_api.get_system_info()
 
     def get_system(self) -> Dict[str, Any]:
         """Get system information."""
-        self._ensure_logged_in()
+        self._ensure_session()
         return self.system_api.get_system()
 
     # Software API methods
-    def get_installed_software_version(self) -> Dict[str, Any]:
+    def get_installed_software_version(
+        self, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Any]:
         """Get installed software version information."""
-        self._ensure_logged_in()
-        return self.software_api.get_installed_software_version()
+        self._ensure_session()
+        return self.software_api.get_installed_software_version(fields=fields)
 
-    def get_candidate_software_versions(self) -> Dict[str, Any]:
+    def get_candidate_software_versions(
+        self, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Any]:
         """Get candidate software versions."""
-        self._ensure_logged_in()
-        return self.software_api.get_candidate_software_versions()
+        self._ensure_session()
+        return self.software_api.get_candidate_software_versions(fields=fields)
 
     def prepare_software(self, file_id: str) -> Dict[str, Any]:
         """Prepare the uploaded software package."""
-        self._ensure_logged_in()
-        return self.software_api.prepare_software(file_id)
+        return self._call_logged_in(lambda: self.software_api.prepare_software(file_id))
 
     def upload_package(self, file_path: str) -> Dict[str, Any]:
         """Upload a software package."""
-        self._ensure_logged_in()
-        return self.software_api.upload_package(file_path)
+        return self._call_logged_in(lambda: self.software_api.upload_package(file_path))
 
     # Upgrade API methods
-    def get_software_upgrade_sessions(self) -> Dict[str, Any]:
+    def get_software_upgrade_sessions(
+        self, fields: Optional[Union[str, Iterable[str]]] = None
+    ) -> Dict[str, Any]:
         """Get software upgrade sessions."""
-        self._ensure_logged_in()
-        return self.upgrade_api.get_software_upgrade_sessions()
+        self._ensure_session()
+        return self.upgrade_api.get_software_upgrade_sessions(fields=fields)
 
     def get_software_upgrade_session(self, session_id: str) -> Dict[str, Any]:
         """Get a specific software upgrade session."""
-        self._ensure_logged_in()
+        self._ensure_session()
         return self.upgrade_api.get_software_upgrade_session(session_id)
 
     def verify_upgrade_eligibility(
@@ -295,8 +531,9 @@ class UnisphereClient:
             If raw_json is True:
                 Raw JSON response from the API
         """
-        self._ensure_logged_in()
-        response = self.upgrade_api.verify_upgrade_eligibility(version=version)
+        response = self._call_logged_in(
+            lambda: self.upgrade_api.verify_upgrade_eligibility(version=version)
+        )
 
         # Return raw response if requested
         if raw_json:
@@ -310,56 +547,41 @@ class UnisphereClient:
             "requiredHotfixes": [],
         }
 
+        # Look the content up once for every format below
+        content = response.get("content")
+        if not isinstance(content, dict):
+            content = {}
+
         # Handle the mock API format (test_verify_upgrade_eligibility)
-        if "content" in response and "isEligible" in response["content"]:
-            result["eligible"] = response["content"].get("isEligible", False)
-            result["messages"] = response["content"].get("messages", [])
+        if "isEligible" in content:
+            result["eligible"] = content.get("isEligible", False)
+            result["messages"] = content.get("messages", [])
             return result
 
-        # Special case for test_verify_upgrade_eligibility_real_machine_format
-        if (
-            "content" in response
-            and "statusMessage" in response["content"]
-            and response["content"].get("statusMessage") == "Some error occurred"
-        ):
-            # This is a direct match for the test case
-            result["eligible"] = False
-            result["messages"] = ["Some error occurred"]
+        # A non-empty status message is an error
+        status_message = content.get("statusMessage")
+        if status_message and status_message.strip():
+            result["messages"] = [status_message]
             return result
 
-        # Handle other status messages
-        if "content" in response and "statusMessage" in response["content"]:
-            status_message = response["content"].get("statusMessage")
-            if status_message and status_message.strip():
-                result["eligible"] = False
-                result["messages"] = [status_message]
-                return result
-
-        # This section is now handled by the previous block
-
         # Handle the real machine success format
         # Success case: overallStatus=false and empty statusMessage
-        if (
-            "content" in response
-            and "overallStatus" in response["content"]
-            and response["content"].get("overallStatus") is False
-        ):
+        if content.get("overallStatus") is False:
             result["eligible"] = True
             return result
 
         # Handle the real machine error format with detailed messages
-        messages = response.get("content", {}).get("messages")
+        messages = content.get("messages")
         if isinstance(messages, list) and messages:
             # Extract error messages from the nested structure
-            error_messages = []
-            for msg_obj in messages:
-                if "messages" in msg_obj and isinstance(msg_obj["messages"], list):
-                    for locale_msg in msg_obj["messages"]:
-                        if "message" in locale_msg:
-                            error_messages.append(locale_msg["message"])
-
+            error_messages = [
+                locale_msg["message"]
+                for msg_obj in messages
+                if isinstance(msg_obj.get("messages"), list)
+                for locale_msg in msg_obj["messages"]
+                if "message" in locale_msg
+            ]
             if error_messages:
-                result["eligible"] = False
                 result["messages"] = error_messages
                 return result
 
@@ -367,9 +589,9 @@ class UnisphereClient:
         if "eligible" in response:
             result["eligible"] = response.get("eligible", False)
             result["messages"] = response.get("messages", [])
-        elif "content" in response and "eligible" in response["content"]:
-            result["eligible"] = response["content"].get("eligible", False)
-            result["messages"] = response["content"].get("messages", [])
+        elif "eligible" in content:
+            result["eligible"] = content.get("eligible", False)
+            result["messages"] = content.get("messages", [])
 
         # If we reach here with no matches, use the default response
         return result
@@ -390,12 +612,12 @@ class UnisphereClient:
             APIError: If the API returns an error.
             AuthenticationError: If not authenticated.
         """
-        self._ensure_logged_in()
-
         try:
             # Attempt to create the upgrade session
-            result = self.upgrade_api.create_upgrade_session(
-                candidate_version_id, description
+            result = self._call_logged_in(
+                lambda: self.upgrade_api.create_upgrade_session(
+                    candidate_version_id, description
+                )
             )
 
             # No session management in stateless mode
@@ -404,7 +626,7 @@ class UnisphereClient:
 
         except Exception as e:
             # Log detailed error information in verbose mode
-            if self.verbose:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.error(
                     "\n====== ERROR CREATING UPGRADE SESSION =============================="
                 )
@@ -429,8 +651,9 @@ class UnisphereClient:
 
     def resume_upgrade_session(self, session_id: str) -> Dict[str, Any]:
         """Resume a software upgrade session."""
-        self._ensure_logged_in()
-        return self.upgrade_api.resume_upgrade_session(session_id)
+        return self._call_logged_in(
+            lambda: self.upgrade_api.resume_upgrade_session(session_id)
+        )
 
     def monitor_upgrade_sessions(self, raw_json: bool = False) -> Dict[str, Any]:
         """Monitor all upgrade sessions (stateless operation, no ID needed).
@@ -448,7 +671,7 @@ class UnisphereClient:
             If raw_json is True:
                 Raw JSON response from the API.
         """
-        self._ensure_logged_in()
+        self._ensure_session()
 
         # Define the fields we want to retrieve based on the curl example
         fields = "status,caption,percentComplete,type,elapsedTime,tasks"
@@ -472,7 +695,7 @@ class UnisphereClient:
             return {"sessions": sessions, "count": len(sessions)}
 
         except Exception as e:
-            if self.verbose:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.error(f"Error monitoring upgrade sessions: {str(e)}")
             # Return empty result on error
             if raw_json:
@@ -491,16 +714,72 @@ class UnisphereClient:
         Returns:
             Final session status information
         """
-        self._ensure_logged_in()
+        self._ensure_session()
         return self.upgrade_api.monitor_upgrade_session(interval, timeout)
 
+    def _ensure_session(self):
+        """Ensure a session and API clients exist for read-only calls.
+
+        GET requests authenticate with the Basic credentials alone, so the
+        login round trip for the CSRF token is deferred until a mutating
+        call needs it.
+        """
+        if self.session is None:
+            self.session = self._create_session()
+        if self.system_api is None:
+            self._initialize_api_clients()
+
     def _ensure_logged_in(self):
         """Ensure the client is logged in.
 
-        In the stateless approach, we authenticate for every API call.
+        The login and its CSRF token are reused until ``auth_ttl`` expires
+        or the client logs out. Without a current login, a session saved by
+        an earlier process with the same credentials is restored instead of
+        logging in again.
+        """
+        if (
+            self._logged_in
+            and self.session is not None
+            and time.monotonic() - self._login_time < self.auth_ttl
+        ):
+            return
+        if not self._logged_in:
+            try:
+                session_data = self._load_session()
+            except ValueError as e:
+                logger.warning("Ignoring session file: %s", e)
+                session_data = None
+            if self._should_reuse_session(session_data):
+                self._restore_session(session_data)
+                return
+        self.login()
+
+    def _call_logged_in(self, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run a mutating API call after ensuring the client is logged in.
+
+        The array can end a session before ``auth_ttl`` runs out, so a 401
+        for a session restored from the session file removes the file and
+        retries the call once after a fresh login.
+
+        Args:
+            call: Callable making the API request.
+
+        Returns:
+            Result of the call.
+
+        Raises:
+            AuthenticationError: When the call is rejected after a fresh login.
         """
-        # Always login for each API call in stateless mode
+        self._ensure_logged_in()
+        try:
+            return call()
+        except AuthenticationError:
+            if not self._session_restored:
+                raise
+            logger.debug("Saved session was rejected, logging in again")
+        self._remove_session_file()
         self.login()
+        return call()
 
     def get_status_text(self, status: int) -> str:
         """Convert status code to text.
@@ -516,10 +795,23 @@ class UnisphereClient:
         return self.upgrade_api.get_status_text(status)
 
     def __enter__(self):
-        """Context manager entry."""
-        self.login()
+        """Context manager entry.
+
+        Login is deferred until the first call that needs a CSRF token.
+        """
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.logout()
+        """Context manager exit.
+
+        Logs out after a login; a session used only for read-only calls is
+        closed without the logout request.
+        """
+        if self._logged_in:
+            self.logout()
+        elif self.session is not None:
+            self._close_session(self.session)
+            self.session = None
+            self.system_api = None
+            self.software_api = None
+            self.upgrade_api = None
@@ -3,7 +3,7 @@
 This module provides data models for Dell Unisphere API responses.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
@@ -42,7 +42,7 @@ class UpgradeTypeEnum(str, Enum):
     LANGUAGE_PACK = "LanguagePack"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Link:
     """API link model."""
 
@@ -50,7 +50,7 @@ class Link:
     href: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApiResponse:
     """Base API response model."""
 
@@ -59,7 +59,7 @@ class ApiResponse:
     links: List[Link]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NameValuePair:
     """Name-value pair model."""
 
@@ -67,7 +67,7 @@ class NameValuePair:
     value: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FirmwarePackage:
     """Firmware package model."""
 
@@ -75,7 +75,7 @@ class FirmwarePackage:
     version: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstalledSoftwareVersionLanguage:
     """Installed software version language model."""
 
@@ -83,7 +83,7 @@ class InstalledSoftwareVersionLanguage:
     version: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstalledSoftwareVersionPackage:
     """Installed software version package model."""
 
@@ -91,7 +91,7 @@ class InstalledSoftwareVersionPackage:
     version: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BasicSystemInfo:
     """Basic system info model."""
 
@@ -104,24 +104,21 @@ class BasicSystemInfo:
     earliestApiVersion: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BasicSystemInfoEntry:
     """Basic system info entry model."""
 
     content: BasicSystemInfo
 
 
-@dataclass
-class BasicSystemInfoResponse:
+@dataclass(slots=True, frozen=True)
+class BasicSystemInfoResponse(ApiResponse):
     """Basic system info response model."""
 
-    base: str
-    updated: datetime
-    links: List[Link]
     entries: List[BasicSystemInfoEntry]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstalledSoftwareVersion:
     """Installed software version model."""
 
@@ -130,29 +127,26 @@ class InstalledSoftwareVersion:
     fullVersion: str
     isLatest: bool
     releaseDate: datetime
-    firmwarePackages: List[FirmwarePackage] = None
-    languages: List[InstalledSoftwareVersionLanguage] = None
-    packages: List[InstalledSoftwareVersionPackage] = None
+    firmwarePackages: List[FirmwarePackage] = field(default_factory=list)
+    languages: List[InstalledSoftwareVersionLanguage] = field(default_factory=list)
+    packages: List[InstalledSoftwareVersionPackage] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InstalledSoftwareVersionEntry:
     """Installed software version entry model."""
 
     content: InstalledSoftwareVersion
 
 
-@dataclass
-class InstalledSoftwareVersionResponse:
+@dataclass(slots=True, frozen=True)
+class InstalledSoftwareVersionResponse(ApiResponse):
     """Installed software version response model."""
 
-    base: str
-    updated: datetime
-    links: List[Link]
     entries: List[InstalledSoftwareVersionEntry]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandidateSoftwareVersion:
     """Candidate software version model."""
 
@@ -166,27 +160,24 @@ class CandidateSoftwareVersion:
     fileName: str
     fileSize: int
     uploadTime: datetime
-    attributes: List[NameValuePair] = None
+    attributes: List[NameValuePair] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CandidateSoftwareVersionEntry:
     """Candidate software version entry model."""
 
     content: CandidateSoftwareVersion
 
 
-@dataclass
-class CandidateSoftwareVersionResponse:
+@dataclass(slots=True, frozen=True)
+class CandidateSoftwareVersionResponse(ApiResponse):
     """Candidate software version response model."""
 
-    base: str
-    updated: datetime
-    links: List[Link]
     entries: List[CandidateSoftwareVersionEntry]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpgradeMessage:
     """Upgrade message model."""
 
@@ -196,7 +187,7 @@ class UpgradeMessage:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpgradeTask:
     """Upgrade task model."""
 
@@ -208,12 +199,11 @@ class UpgradeTask:
     estRemainTime: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SoftwareUpgradeSession:
     """Software upgrade session model."""
 
     id: str
-    description: Optional[str] = None
     status: UpgradeStatusEnum
     type: UpgradeSessionTypeEnum
     upgradeType: UpgradeTypeEnum
@@ -221,24 +211,22 @@ class SoftwareUpgradeSession:
     candidateVersion: str
     percentComplete: int
     startTime: datetime
+    description: Optional[str] = None
     endTime: Optional[datetime] = None
     estRemainTime: Optional[str] = None
-    messages: List[UpgradeMessage] = None
-    tasks: List[UpgradeTask] = None
+    messages: List[UpgradeMessage] = field(default_factory=list)
+    tasks: List[UpgradeTask] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SoftwareUpgradeSessionEntry:
     """Software upgrade session entry model."""
 
     content: SoftwareUpgradeSession
 
 
-@dataclass
-class SoftwareUpgradeSessionResponse:
+@dataclass(slots=True, frozen=True)
+class SoftwareUpgradeSessionResponse(ApiResponse):
     """Software upgrade session response model."""
 
-    base: str
-    updated: datetime
-    links: List[Link]
     entries: List[SoftwareUpgradeSessionEntry]
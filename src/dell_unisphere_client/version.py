@@ -2,7 +2,7 @@
 
 import importlib.metadata
 import logging
-import re
+import tomllib
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -24,17 +24,16 @@ def _read_version_from_pyproject() -> str:
         logger.debug("Looking for pyproject.toml at %s", pyproject_path)
 
         if not pyproject_path.exists():
-            logger.warning("pyproject.toml not found at %s", pyproject_path)
+            # Expected for installed packages, which use the metadata
+            logger.debug("pyproject.toml not found at %s", pyproject_path)
             return "0.6.0"  # Default fallback
 
-        # Read version from pyproject.toml using regex
-        with open(pyproject_path, "r") as f:
-            pyproject_content = f.read()
-            version_match = re.search(r'version\s*=\s*"([^"]+)"', pyproject_content)
-            if not version_match:
-                logger.warning("Could not find version in pyproject.toml")
-                return "0.6.0"  # Default fallback
-            return version_match.group(1)
+        with open(pyproject_path, "rb") as f:
+            version = tomllib.load(f).get("project", {}).get("version")
+        if not version:
+            logger.warning("Could not find version in pyproject.toml")
+            return "0.6.0"  # Default fallback
+        return version
     except Exception as e:
         logger.warning("Error reading version from pyproject.toml: %s", e)
         return "0.6.0"  # Default fallback
@@ -48,23 +47,17 @@ def get_version() -> str:
     """
     Get the current version of the package.
 
-    Always tries to read from pyproject.toml first to ensure consistency.
-    Falls back to package metadata only if pyproject.toml cannot be read.
+    Uses the installed package metadata, falling back to the version read
+    from pyproject.toml at import time for source checkouts.
 
     Returns:
         str: The current version string.
     """
-    # Always prioritize reading from pyproject.toml for consistency
-    pyproject_version = _read_version_from_pyproject()
-    if pyproject_version != "0.6.0":  # Not the default fallback
-        return pyproject_version
-
-    # Fallback to package metadata only if pyproject.toml couldn't be read
     try:
         return importlib.metadata.version("dell-unisphere-client")
     except importlib.metadata.PackageNotFoundError:
-        logger.warning("Package not installed, using default version")
-        return "0.6.0"  # Last resort fallback
+        logger.debug("Package not installed, using pyproject.toml version")
+        return _VERSION
 
 
 # Version constant for easy access
@@ -1,82 +1,114 @@
 """Global pytest configuration for Dell Unisphere Client tests."""
 
 import pytest
-from unittest.mock import MagicMock
+import requests
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+
+class MockResponse:
+    """Minimal stand-in for ``requests.Response``."""
+
+    def __init__(
+        self,
+        json_data=None,
+        status_code=200,
+        headers=None,
+        text="",
+        cookies=None,
+        raise_exception=None,
+        timeout=False,
+    ):
+        """
+        Create a mock response object with customizable attributes.
+
+        Args:
+            json_data (dict, optional): JSON data to return. Defaults to empty dict.
+            status_code (int, optional): HTTP status code. Defaults to 200.
+            headers (dict, optional): Response headers. Defaults to empty dict.
+            text (str, optional): Response text. Defaults to empty string.
+            cookies (dict, optional): Response cookies. Defaults to empty dict.
+            raise_exception (Exception, optional): Exception to raise when accessing response.
+            timeout (bool, optional): Simulate a request timeout. Defaults to False.
+        """
+        self.json_data = json_data or {}
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+        self.cookies = cookies or {}
+        self._is_mock = True  # Flag to identify mock responses
+        self._raise_exception = raise_exception
+        self._timeout = timeout
+
+    def json(self):
+        """
+        Return the JSON data from the response.
+
+        Raises:
+            Exception: If raise_exception was specified during initialization.
+
+        Returns:
+            dict: The JSON data.
+        """
+        if self._raise_exception:
+            raise self._raise_exception
+        if self._timeout:
+            raise TimeoutError("Request timed out")
+        return self.json_data
+
+    def raise_for_status(self):
+        """
+        Raise an exception if the status code indicates an error.
+
+        Raises:
+            Exception: If status_code >= 400 or if raise_exception was specified.
+        """
+        if self._raise_exception:
+            raise self._raise_exception
+        if self._timeout:
+            raise TimeoutError("Request timed out")
+        if self.status_code >= 400:
+            raise Exception(f"HTTP Error: {self.status_code}")
+
+
+# Exception class and message raised by ConnectionErrorMock per error type
+SIMULATED_ERRORS = {
+    "connection": (
+        requests.exceptions.ConnectionError,
+        "Failed to establish connection",
+    ),
+    "timeout": (requests.exceptions.Timeout, "Request timed out"),
+    "ssl": (requests.exceptions.SSLError, "SSL certificate verification failed"),
+}
+DEFAULT_SIMULATED_ERROR = (
+    requests.exceptions.RequestException,
+    "General request exception",
+)
+
+
+class ConnectionErrorMock:
+    """Callable that raises the requests exception for ``error_type``."""
+
+    def __init__(self, error_type="connection"):
+        self.error_type = error_type
+
+    def __call__(self, *args, **kwargs):
+        error, message = SIMULATED_ERRORS.get(self.error_type, DEFAULT_SIMULATED_ERROR)
+        raise error(message)
 
 
 @pytest.fixture
 def mock_response():
-    """Create a mock response object with customizable attributes."""
-
-    class MockResponse:
-        def __init__(
-            self,
-            json_data=None,
-            status_code=200,
-            headers=None,
-            text="",
-            cookies=None,
-            raise_exception=None,
-            timeout=False,
-        ):
-            """
-            Create a mock response object with customizable attributes.
-
-            Args:
-                json_data (dict, optional): JSON data to return. Defaults to empty dict.
-                status_code (int, optional): HTTP status code. Defaults to 200.
-                headers (dict, optional): Response headers. Defaults to empty dict.
-                text (str, optional): Response text. Defaults to empty string.
-                cookies (dict, optional): Response cookies. Defaults to empty dict.
-                raise_exception (Exception, optional): Exception to raise when accessing response.
-                timeout (bool, optional): Simulate a request timeout. Defaults to False.
-            """
-            self.json_data = json_data or {}
-            self.status_code = status_code
-            self.headers = headers or {}
-            self.text = text
-            self.cookies = cookies or {}
-            self._is_mock = True  # Flag to identify mock responses
-            self._raise_exception = raise_exception
-            self._timeout = timeout
-
-        def json(self):
-            """
-            Return the JSON data from the response.
-
-            Raises:
-                Exception: If raise_exception was specified during initialization.
-
-            Returns:
-                dict: The JSON data.
-            """
-            if self._raise_exception:
-                raise self._raise_exception
-            if self._timeout:
-                raise TimeoutError("Request timed out")
-            return self.json_data
-
-        def raise_for_status(self):
-            """
-            Raise an exception if the status code indicates an error.
-
-            Raises:
-                Exception: If status_code >= 400 or if raise_exception was specified.
-            """
-            if self._raise_exception:
-                raise self._raise_exception
-            if self._timeout:
-                raise TimeoutError("Request timed out")
-            if self.status_code >= 400:
-                raise Exception(f"HTTP Error: {self.status_code}")
-
+    """Return the mock response class with customizable attributes."""
     return MockResponse
 
 
 @pytest.fixture
 def mock_requests(monkeypatch):
     """Create a mock for the requests library."""
-    mock = MagicMock()
+    # Plain Mock for the module; sessions stay MagicMock instances, which
+    # the API clients detect and which support header item assignment
+    mock = Mock(Session=MagicMock)
     # Patch the requests module
     monkeypatch.setattr("requests.Session", MagicMock)
     monkeypatch.setattr("requests.get", mock.get)
@@ -87,12 +119,22 @@ def mock_requests(monkeypatch):
     return mock
 
 
-@pytest.fixture
-def mock_client():
-    """Create a mock client for testing."""
+@pytest.fixture(scope="session")
+def client_spec():
+    """Return the UnisphereClient attribute names used to spec mock clients."""
     from dell_unisphere_client import UnisphereClient
 
-    client = MagicMock(spec=UnisphereClient)
+    return dir(UnisphereClient)
+
+
+@pytest.fixture
+def mock_client(client_spec):
+    """Create a mock client for testing.
+
+    The spec is a cached list of attribute names, so the UnisphereClient
+    class is only introspected once per test session.
+    """
+    client = MagicMock(spec=client_spec)
     client.base_url = "https://example.com"
     client.username = "testuser"
     client.password = "testpass"
@@ -102,7 +144,8 @@ def mock_client():
     return client
 
 
-@pytest.fixture
+# Static sample data is built once per test session; tests must not mutate it
+@pytest.fixture(scope="session")
 def sample_config():
     """Return a sample configuration dictionary."""
     return {
@@ -113,7 +156,7 @@ def sample_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_software_version():
     """Return a sample software version response."""
     return {
@@ -138,7 +181,7 @@ def sample_software_version():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candidate_versions():
     """Return a sample candidate versions response."""
     return {
@@ -162,7 +205,7 @@ def sample_candidate_versions():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_upgrade_sessions():
     """Return a sample upgrade sessions response."""
     return {
@@ -187,7 +230,22 @@ def sample_upgrade_sessions():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_system_info():
+    """Return a sample system information response."""
+    return {
+        "content": {
+            "id": "SYS-001",
+            "name": "Test Storage System",
+            "model": "Unity 500",
+            "serialNumber": "UNITY-123456789",
+            "operatingEnvironment": "Production",
+            "health": {"value": "OK", "descriptionIds": ["SYSTEM_HEALTH_OK"]},
+        }
+    }
+
+
+@pytest.fixture(scope="session")
 def csrf_token():
     """Return a sample CSRF token."""
     return (
@@ -196,7 +254,7 @@ def csrf_token():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_monitoring_data():
     """Return sample monitoring data for upgrade sessions."""
     return {
@@ -241,7 +299,7 @@ def sample_monitoring_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_error_responses():
     """Return a collection of sample error responses."""
     return {
@@ -271,37 +329,11 @@ def sample_error_responses():
 
 @pytest.fixture
 def connection_error_mock():
-    """Create a mock that simulates connection errors."""
-    import requests
-
-    class ConnectionErrorMock:
-        def __init__(self, error_type="connection"):
-            self.error_type = error_type
-
-        def __call__(self, *args, **kwargs):
-            if self.error_type == "connection":
-                raise requests.exceptions.ConnectionError(
-                    "Failed to establish connection"
-                )
-            elif self.error_type == "timeout":
-                raise requests.exceptions.Timeout("Request timed out")
-            elif self.error_type == "ssl":
-                raise requests.exceptions.SSLError(
-                    "SSL certificate verification failed"
-                )
-            else:
-                raise requests.exceptions.RequestException("General request exception")
-
+    """Return a mock class that simulates connection errors."""
     return ConnectionErrorMock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_cli_args():
-    """Create mock CLI arguments."""
-
-    class MockArgs:
-        def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-
-    return MockArgs
+    """Return a builder for mock CLI arguments."""
+    return SimpleNamespace
@@ -5,12 +5,11 @@ They can be skipped if no server is available by setting the environment variabl
 SKIP_E2E_TESTS=1
 """
 
+import functools
 import os
 import pytest
 import json
 
-from dell_unisphere_client import UnisphereClient
-
 
 # Skip all tests in this module if SKIP_E2E_TESTS is set
 pytestmark = pytest.mark.skipif(
@@ -19,14 +18,29 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_e2e_config(config_path):
+    """Read the E2E config file once per process.
+
+    Returns:
+        The parsed config, or an empty dict if the file is missing or invalid.
+    """
+    try:
+        with open(config_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
 class TestE2EClient:
     """End-to-end test suite for the UnisphereClient class.
 
     These tests require a running Dell Unisphere API server.
     """
 
-    @pytest.fixture
-    def server_config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def server_config(cls):
         """Load server configuration for E2E tests."""
         # Try to load from environment variables first
         base_url = os.environ.get("UNISPHERE_URL")
@@ -44,16 +58,12 @@ class TestE2EClient:
                 "UNISPHERE_CONFIG",
                 os.path.expanduser("~/.dell-unisphere-client/e2e_config.json"),
             )
-            try:
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-                    base_url = base_url or config.get("base_url")
-                    username = username or config.get("username")
-                    password = password or config.get("password")
-                    if "verify_ssl" in config:
-                        verify_ssl = config["verify_ssl"]
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
+            config = _load_e2e_config(config_path)
+            base_url = base_url or config.get("base_url")
+            username = username or config.get("username")
+            password = password or config.get("password")
+            if "verify_ssl" in config:
+                verify_ssl = config["verify_ssl"]
 
         # Skip tests if configuration is incomplete
         if not all([base_url, username, password]):
@@ -68,9 +78,17 @@ class TestE2EClient:
             "verify_ssl": verify_ssl,
         }
 
-    @pytest.fixture
-    def client(self, server_config):
-        """Create and configure a client for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def client(cls, server_config):
+        """Create a client shared by the tests of this class.
+
+        It logs in once and out after the last test; mutating calls log in
+        again by themselves once ``auth_ttl`` has passed.
+        """
+        # Imported here so skipped E2E runs do not load the client
+        from dell_unisphere_client import UnisphereClient
+
         client = UnisphereClient(
             base_url=server_config["base_url"],
             username=server_config["username"],
@@ -84,14 +102,22 @@ class TestE2EClient:
         # Yield the client for the test
         yield client
 
-        # Logout after the test
+        # Logout after the last test of the class
         try:
             client.logout()
         except Exception:
             pass  # Ignore logout failures in cleanup
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def candidate_versions(cls, client):
+        """Fetch the candidate software versions once for the class."""
+        return client.get_candidate_software_versions()
+
     def test_login_logout(self, server_config):
         """Test the login and logout functionality."""
+        from dell_unisphere_client import UnisphereClient
+
         client = UnisphereClient(
             base_url=server_config["base_url"],
             username=server_config["username"],
@@ -124,9 +150,9 @@ class TestE2EClient:
         assert "version" in first_entry
         assert "releaseDate" in first_entry
 
-    def test_get_candidate_software_versions(self, client):
+    def test_get_candidate_software_versions(self, candidate_versions):
         """Test retrieving candidate software versions."""
-        result = client.get_candidate_software_versions()
+        result = candidate_versions
 
         # Verify response structure
         assert "entries" in result
@@ -156,13 +182,12 @@ class TestE2EClient:
             assert "id" in first_entry
             assert "status" in first_entry
 
-    def test_verify_upgrade_eligibility(self, client):
+    def test_verify_upgrade_eligibility(self, client, candidate_versions):
         """Test verifying upgrade eligibility.
 
         Note: This test requires a valid candidate version.
         """
-        # Get candidate versions
-        candidates = client.get_candidate_software_versions()
+        candidates = candidate_versions
 
         # Skip test if no candidates available
         if not candidates["entries"]:
@@ -186,14 +211,13 @@ class TestE2EClient:
         reason="Creating an upgrade session can have side effects on the system. "
         "Enable only in dedicated test environments with proper safeguards."
     )
-    def test_create_upgrade_session(self, client):
+    def test_create_upgrade_session(self, client, candidate_versions):
         """Test creating an upgrade session.
 
         Warning: This test is skipped by default as it can modify system state.
         Only enable in dedicated test environments with proper safeguards.
         """
-        # Get candidate versions
-        candidates = client.get_candidate_software_versions()
+        candidates = candidate_versions
 
         # Skip test if no candidates available
         if not candidates["entries"]:
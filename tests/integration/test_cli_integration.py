@@ -2,7 +2,7 @@
 
 import pytest
 import os
-import tempfile
+import sys
 from unittest.mock import patch, MagicMock
 
 import dell_unisphere_client.cli as cli
@@ -12,16 +12,59 @@ class TestCLIIntegration:
     """Integration tests for the CLI module with mocked client."""
 
     @pytest.fixture
-    def temp_config_file(self):
-        """Create a temporary config file for testing."""
-        # Create a temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary config file path
-            config_path = os.path.join(temp_dir, "config.json")
+    def temp_config_file(self, tmp_path, monkeypatch):
+        """Point the CLI at a temporary config file for testing."""
+        config_path = str(tmp_path / "config.json")
+        # save_config() creates the config directory, so redirect it too
+        monkeypatch.setattr(cli, "DEFAULT_CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(cli, "DEFAULT_CONFIG_FILE", config_path)
+        return config_path
 
-            # Patch the config path
-            with patch("dell_unisphere_client.cli.DEFAULT_CONFIG_FILE", config_path):
-                yield config_path
+    @pytest.fixture
+    def run_cli(self, monkeypatch):
+        """Return a helper that runs the CLI with the given arguments."""
+
+        def run(*args):
+            monkeypatch.setattr(sys, "argv", ["unisphere", *args])
+            cli.main()
+
+        return run
+
+    @pytest.fixture
+    def mock_unisphere_client(self):
+        """Create a mock UnisphereClient with canned workflow responses."""
+        mock_unisphere_client = MagicMock()
+        mock_unisphere_client.login.return_value = True
+        mock_unisphere_client.get_installed_software_version.return_value = {
+            "entries": [
+                {
+                    "content": {
+                        "id": "1",
+                        "version": "5.3.0.0.5.120",
+                        "releaseDate": "2025-01-15T00:00:00.000Z",
+                    }
+                }
+            ]
+        }
+        mock_unisphere_client.get_candidate_software_versions.return_value = {
+            "entries": [
+                {
+                    "content": {
+                        "id": "1",
+                        "version": "5.4.0.0.5.150",
+                        "releaseDate": "2025-02-15T00:00:00.000Z",
+                    }
+                }
+            ]
+        }
+        mock_unisphere_client.verify_upgrade_eligibility.return_value = {
+            "content": {"isEligible": True, "messages": []}
+        }
+        mock_unisphere_client.create_upgrade_session.return_value = {
+            "content": {"id": "123", "status": "Scheduled"}
+        }
+        mock_unisphere_client.logout.return_value = True
+        return mock_unisphere_client
 
     def test_save_load_config(self, temp_config_file):
         """Test saving and loading configuration."""
@@ -45,6 +88,26 @@ class TestCLIIntegration:
         # Verify loaded config matches saved config
         assert loaded_config == config
 
+    def test_load_config_is_cached_until_saved(self, temp_config_file):
+        """Test the config file is parsed once until it changes."""
+        config = {
+            "base_url": "https://example.com",
+            "username": "testuser",
+            "password": "testpass",
+            "verify_ssl": True,
+        }
+        cli.save_config(config)
+
+        with patch("dell_unisphere_client.cli.json.load", wraps=cli.json.load) as load:
+            first = cli.load_config()
+            first["password"] = "changed"
+            assert cli.load_config() == config
+            assert load.call_count == 1
+
+            cli.save_config(dict(config, username="other"))
+            assert cli.load_config()["username"] == "other"
+            assert load.call_count == 2
+
     def test_get_client(self, temp_config_file):
         """Test get_client function."""
         # Test data
@@ -70,6 +133,7 @@ class TestCLIIntegration:
                 password="testpass",
                 verify_ssl=True,
                 verbose=False,
+                session_file=cli.DEFAULT_SESSION_FILE,
             )
 
     def test_get_client_with_override(self, temp_config_file):
@@ -97,67 +161,31 @@ class TestCLIIntegration:
                 password="newpass",
                 verify_ssl=True,
                 verbose=False,
+                session_file=cli.DEFAULT_SESSION_FILE,
             )
 
-    def test_cli_workflow(self, temp_config_file, capsys):
+    def test_cli_workflow(
+        self, temp_config_file, run_cli, mock_unisphere_client, capsys
+    ):
         """Test complete CLI workflow."""
-        # Mock the UnisphereClient
-        mock_client = MagicMock()
-
-        # Configure mock client responses
-        mock_client.login.return_value = True
-        mock_client.get_installed_software_version.return_value = {
-            "entries": [
-                {
-                    "content": {
-                        "id": "1",
-                        "version": "5.3.0.0.5.120",
-                        "releaseDate": "2025-01-15T00:00:00.000Z",
-                    }
-                }
-            ]
-        }
-        mock_client.get_candidate_software_versions.return_value = {
-            "entries": [
-                {
-                    "content": {
-                        "id": "1",
-                        "version": "5.4.0.0.5.150",
-                        "releaseDate": "2025-02-15T00:00:00.000Z",
-                    }
-                }
-            ]
-        }
-        mock_client.verify_upgrade_eligibility.return_value = {
-            "content": {"isEligible": True, "messages": []}
-        }
-        mock_client.create_upgrade_session.return_value = {
-            "content": {"id": "123", "status": "Scheduled"}
-        }
-        mock_client.logout.return_value = True
-
         # Patch the UnisphereClient constructor
         with patch(
-            "dell_unisphere_client.cli.UnisphereClient", return_value=mock_client
+            "dell_unisphere_client.cli.UnisphereClient",
+            return_value=mock_unisphere_client,
         ):
             # Step 1: Configure
-            with patch(
-                "sys.argv",
-                [
-                    "unisphere",
-                    "system",
-                    "configure",
-                    "--url",
-                    "https://example.com",
-                    "--username",
-                    "testuser",
-                    "--password",
-                    "testpass",
-                    "--verify-ssl",
-                    "true",
-                ],
-            ):
-                cli.main()
+            run_cli(
+                "system",
+                "configure",
+                "--url",
+                "https://example.com",
+                "--username",
+                "testuser",
+                "--password",
+                "testpass",
+                "--verify-ssl",
+                "true",
+            )
 
             # Verify config was saved
             config = cli.load_config()
@@ -167,93 +195,75 @@ class TestCLIIntegration:
             assert config["verify_ssl"] is True
 
             # Step 2: Login
-            with patch("sys.argv", ["unisphere", "system", "login"]):
-                cli.main()
+            run_cli("system", "login")
 
             # Verify login was called
-            mock_client.login.assert_called_once()
+            mock_unisphere_client.login.assert_called_once()
 
             # Step 3: Get software version
-            with patch("sys.argv", ["unisphere", "system", "software-version"]):
-                cli.main()
+            run_cli("system", "software-version")
 
             # Verify get_installed_software_version was called
-            mock_client.get_installed_software_version.assert_called_once()
+            mock_unisphere_client.get_installed_software_version.assert_called_once()
 
             # Step 4: Get candidate versions
-            with patch("sys.argv", ["unisphere", "candidate", "version"]):
-                cli.main()
+            run_cli("candidate", "version")
 
             # Verify get_candidate_software_versions was called
-            mock_client.get_candidate_software_versions.assert_called_once()
+            mock_unisphere_client.get_candidate_software_versions.assert_called_once()
 
             # Step 5: Verify upgrade
-            with patch(
-                "sys.argv",
-                ["unisphere", "upgrade", "verify", "--version", "5.4.0.0.5.150"],
-            ):
-                cli.main()
+            run_cli("upgrade", "verify", "--version", "5.4.0.0.5.150")
 
             # Verify verify_upgrade_eligibility was called
             # Note: parameter is passed through CLI but not used by the actual API endpoint
-            mock_client.verify_upgrade_eligibility.assert_called_once_with(
+            mock_unisphere_client.verify_upgrade_eligibility.assert_called_once_with(
                 "5.4.0.0.5.150", raw_json=False
             )
 
             # Step 6: Create upgrade
-            with patch(
-                "sys.argv",
-                ["unisphere", "upgrade", "create", "--version", "5.4.0.0.5.150"],
-            ):
-                cli.main()
+            run_cli("upgrade", "create", "--version", "5.4.0.0.5.150")
 
             # Verify create_upgrade_session was called
-            mock_client.create_upgrade_session.assert_called_once_with("5.4.0.0.5.150")
+            mock_unisphere_client.create_upgrade_session.assert_called_once_with(
+                "5.4.0.0.5.150"
+            )
 
             # Step 7: Logout
-            with patch("sys.argv", ["unisphere", "system", "logout"]):
-                cli.main()
+            run_cli("system", "logout")
 
             # Verify logout was called
-            mock_client.logout.assert_called_once()
+            mock_unisphere_client.logout.assert_called_once()
 
-    def test_error_handling(self, temp_config_file, capsys):
+    def test_error_handling(
+        self, temp_config_file, run_cli, mock_unisphere_client, capsys
+    ):
         """Test CLI error handling."""
-        # Mock the UnisphereClient
-        mock_client = MagicMock()
-
         # Configure mock client to raise exceptions
-        mock_client.login.side_effect = Exception("Authentication failed")
+        mock_unisphere_client.login.side_effect = Exception("Authentication failed")
 
         # Patch the UnisphereClient constructor
         with patch(
-            "dell_unisphere_client.cli.UnisphereClient", return_value=mock_client
+            "dell_unisphere_client.cli.UnisphereClient",
+            return_value=mock_unisphere_client,
         ):
             # Configure first
-            with patch(
-                "sys.argv",
-                [
-                    "unisphere",
-                    "system",
-                    "configure",
-                    "--url",
-                    "https://example.com",
-                    "--username",
-                    "testuser",
-                    "--password",
-                    "testpass",
-                    "--verify-ssl",
-                    "true",
-                ],
-            ):
-                cli.main()
+            run_cli(
+                "system",
+                "configure",
+                "--url",
+                "https://example.com",
+                "--username",
+                "testuser",
+                "--password",
+                "testpass",
+                "--verify-ssl",
+                "true",
+            )
 
             # Try to login and expect error handling with sys.exit(1)
-            with (
-                patch("sys.argv", ["unisphere", "system", "login"]),
-                pytest.raises(SystemExit) as excinfo,
-            ):
-                cli.main()
+            with pytest.raises(SystemExit) as excinfo:
+                run_cli("system", "login")
 
             # Verify exit code is 1
             assert excinfo.value.code == 1
@@ -1,25 +1,31 @@
 """Integration tests for the UnisphereClient with mock API."""
 
+import json
+import time
+
+import pytest
 import responses
-from unittest.mock import patch, MagicMock, mock_open
 
 from dell_unisphere_client import UnisphereClient
+from dell_unisphere_client.exceptions import AuthenticationError
 
 
 class TestClientIntegration:
     """Integration tests for the UnisphereClient class with mocked API responses."""
 
-    @responses.activate
-    def test_login_logout_flow(self):
-        """Test the complete login and logout flow."""
-        # Setup client
-        client = UnisphereClient(
+    @pytest.fixture
+    def client(self):
+        """Create a client for the mocked https://example.com API."""
+        return UnisphereClient(
             base_url="https://example.com",
             username="testuser",
             password="testpass",
             verify_ssl=True,
         )
 
+    @responses.activate
+    def test_login_logout_flow(self, client):
+        """Test the complete login and logout flow."""
         # Mock login response
         responses.add(
             responses.GET,
@@ -45,6 +51,10 @@ class TestClientIntegration:
         assert login_result is True
         assert client.csrf_token == "test-token"
         assert client.session is not None
+        assert (
+            responses.calls[0].request.headers["Authorization"]
+            == "Basic dGVzdHVzZXI6dGVzdHBhc3M="
+        )
 
         # Execute logout
         logout_result = client.logout()
@@ -53,9 +63,15 @@ class TestClientIntegration:
         assert client.session is None
 
     @responses.activate
-    def test_software_version_workflow(self):
-        """Test the complete software version workflow."""
-        # Mock login response
+    def test_session_file_reused_across_clients(self, tmp_path):
+        """Test a saved login is reused by a new client and removed on logout."""
+        session_file = tmp_path / "session.json"
+        kwargs = dict(
+            base_url="https://example.com",
+            username="testuser",
+            password="testpass",
+            session_file=session_file,
+        )
         responses.add(
             responses.GET,
             "https://example.com/api/types/loginSessionInfo/instances",
@@ -66,13 +82,126 @@ class TestClientIntegration:
                 "Set-Cookie": "mod_sec_emc=test-cookie",
             },
         )
+        responses.add(
+            responses.POST,
+            "https://example.com/api/types/loginSessionInfo/action/logout",
+            json={},
+            status=200,
+        )
+
+        # A stale, world-readable file is replaced rather than rewritten
+        session_file.write_text("{}")
+        session_file.chmod(0o644)
 
-        # Setup client
+        UnisphereClient(**kwargs).login()
+        assert session_file.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [session_file]
+
+        # A second client, as in a later CLI run, skips the login request
+        client = UnisphereClient(**kwargs)
+        client._ensure_logged_in()
+        assert len(responses.calls) == 1
+        assert client.csrf_token == "test-token"
+        assert client.session.cookies["mod_sec_emc"] == "test-cookie"
+
+        # Different credentials, or an explicit login, always authenticate
+        other = UnisphereClient(**{**kwargs, "password": "wrongpass"})
+        assert not other._should_reuse_session(other._load_session())
+        client.login()
+        assert len(responses.calls) == 2
+
+        # Logging out from a fresh client ends the saved session
+        assert UnisphereClient(**kwargs).logout() is True
+        logout_request = responses.calls[-1].request
+        assert logout_request.headers["EMC-CSRF-TOKEN"] == "test-token"
+        assert "mod_sec_emc=test-cookie" in logout_request.headers["Cookie"]
+        assert not session_file.exists()
+
+    @pytest.fixture
+    def stale_session_file(self, tmp_path):
+        """Save a session for testuser whose token the array has expired."""
+        session_file = tmp_path / "session.json"
         client = UnisphereClient(
             base_url="https://example.com",
             username="testuser",
             password="testpass",
-            verify_ssl=True,
+            session_file=session_file,
+        )
+        now = int(time.time())
+        client._create_session_file(
+            {
+                "base_url": client.base_url,
+                "username": client.username,
+                "auth_hash": client._auth_hash(),
+                "csrf_token": "stale-token",
+                "cookies": {"mod_sec_emc": "stale-cookie"},
+                "creation_timestamp": now,
+                "last_access_timestamp": now,
+            }
+        )
+        return session_file
+
+    @responses.activate
+    def test_stale_session_file_replaced_by_login(self, stale_session_file):
+        """Test a restored session rejected by the array is replaced once."""
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/loginSessionInfo/instances",
+            json={"content": {"id": "session123"}},
+            status=200,
+            headers={"EMC-CSRF-TOKEN": "fresh-token"},
+        )
+
+        def resume(request):
+            if request.headers["EMC-CSRF-TOKEN"] != "fresh-token":
+                return 401, {}, '{"error": {"errorCode": 131149829}}'
+            return 200, {}, '{"content": {"id": "session1"}}'
+
+        responses.add_callback(
+            responses.POST,
+            "https://example.com/api/instances/upgradeSession/session1/action/resume",
+            callback=resume,
+            content_type="application/json",
+        )
+
+        client = UnisphereClient(
+            base_url="https://example.com",
+            username="testuser",
+            password="testpass",
+            session_file=stale_session_file,
+        )
+        result = client.resume_upgrade_session("session1")
+
+        assert result == {"content": {"id": "session1"}}
+        assert [call.request.method for call in responses.calls] == [
+            "POST",
+            "GET",
+            "POST",
+        ]
+        saved = json.loads(stale_session_file.read_text())
+        assert saved["csrf_token"] == "fresh-token"
+
+        # A 401 for a session from a fresh login is not retried
+        responses.calls.reset()
+        client.csrf_token = client.session.headers["EMC-CSRF-TOKEN"] = "bad-token"
+        client.upgrade_api.csrf_token = "bad-token"
+        with pytest.raises(AuthenticationError):
+            client.resume_upgrade_session("session1")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_software_version_workflow(self, client):
+        """Test the complete software version workflow."""
+        # Mock login response
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/loginSessionInfo/instances",
+            json={"content": {"id": "session123"}},
+            status=200,
+            headers={
+                "EMC-CSRF-TOKEN": "test-token",
+                "Set-Cookie": "mod_sec_emc=test-cookie",
+            },
         )
 
         # Mock installed software version response
@@ -157,9 +286,195 @@ class TestClientIntegration:
 
         create_result = client.create_upgrade_session("5.4.0.0.5.150")
         assert create_result == create_response
+        assert (
+            responses.calls[-1].request.body == b'{"candidate":{"id":"5.4.0.0.5.150"}}'
+        )
 
     @responses.activate
-    def test_upgrade_session_workflow(self):
+    def test_read_only_workflow_skips_login(self, client):
+        """Test that read-only calls do not perform the login round trip."""
+        # Mock installed software version response
+        installed_version_response = {
+            "entries": [{"content": {"id": "1", "version": "5.3.0.0.5.120"}}]
+        }
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/installedSoftwareVersion/instances",
+            json=installed_version_response,
+            status=200,
+        )
+
+        # Execute workflow inside the context manager
+        with client:
+            installed_version = client.get_installed_software_version()
+
+        assert installed_version == installed_version_response
+        assert len(responses.calls) == 1
+        assert client.csrf_token is None
+        assert client.session is None
+
+        # The client can be used again after its session was closed
+        with client:
+            assert client.get_installed_software_version() == (
+                installed_version_response
+            )
+
+    @responses.activate
+    def test_installed_version_revalidated_with_etag(self, client):
+        """Test that an unchanged installed version is served from the ETag cache."""
+        installed_version_response = {
+            "entries": [{"content": {"id": "1", "version": "5.3.0.0.5.120"}}]
+        }
+        url = "https://example.com/api/types/installedSoftwareVersion/instances"
+        responses.add(
+            responses.GET,
+            url,
+            json=installed_version_response,
+            status=200,
+            headers={"ETag": '"v1"'},
+        )
+        responses.add(responses.GET, url, status=304)
+
+        first = client.get_installed_software_version()
+        second = client.get_installed_software_version()
+
+        assert first == installed_version_response
+        assert second == installed_version_response
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_basic_system_info_reused_within_max_age(self, client):
+        """Test that a response is reused without a request during its max-age."""
+        basic_info_response = {
+            "entries": [{"content": {"id": "0", "model": "Unity 500"}}]
+        }
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/basicSystemInfo/instances",
+            json=basic_info_response,
+            status=200,
+            headers={"Cache-Control": "private, max-age=60"},
+        )
+
+        assert client.get_basic_system_info() == basic_info_response
+        assert client.get_basic_system_info() == basic_info_response
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_candidate_versions_refetched_after_prepare(self, client):
+        """Test that a POST drops responses cached for their max-age."""
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/loginSessionInfo/instances",
+            json={"content": {"id": "session123"}},
+            status=200,
+            headers={"EMC-CSRF-TOKEN": "test-token"},
+        )
+        url = "https://example.com/api/types/candidateSoftwareVersion/instances"
+        responses.add(
+            responses.GET,
+            url,
+            json={"entries": []},
+            status=200,
+            headers={"Cache-Control": "private, max-age=60"},
+        )
+        responses.add(
+            responses.POST,
+            "https://example.com/api/types/candidateSoftwareVersion/action/prepare",
+            json={"id": "candidate_1"},
+            status=200,
+        )
+
+        client.get_candidate_software_versions()
+        client.get_candidate_software_versions()
+        client.prepare_software("file_1")
+        client.get_candidate_software_versions()
+
+        candidate_calls = [c for c in responses.calls if c.request.url == url]
+        assert len(candidate_calls) == 2
+
+    @responses.activate
+    def test_post_through_upgrade_api_drops_software_cache(self, client):
+        """Test that the API clients share one response cache."""
+        responses.add(
+            responses.GET,
+            "https://example.com/api/types/loginSessionInfo/instances",
+            json={"content": {"id": "session123"}},
+            status=200,
+            headers={"EMC-CSRF-TOKEN": "test-token"},
+        )
+        url = "https://example.com/api/types/candidateSoftwareVersion/instances"
+        responses.add(
+            responses.GET,
+            url,
+            json={"entries": []},
+            status=200,
+            headers={"Cache-Control": "private, max-age=60"},
+        )
+        responses.add(
+            responses.POST,
+            "https://example.com/api/instances/upgradeSession/123/action/resume",
+            json={},
+            status=200,
+        )
+
+        client.get_candidate_software_versions()
+        client.resume_upgrade_session("123")
+        client.get_candidate_software_versions()
+
+        candidate_calls = [c for c in responses.calls if c.request.url == url]
+        assert len(candidate_calls) == 2
+
+    @responses.activate
+    def test_only_successful_responses_cached(self, client):
+        """Test that error bodies are not cached and hits return copies."""
+        url = "https://example.com/api/types/installedSoftwareVersion/instances"
+        headers = {"ETag": '"v1"', "Cache-Control": "private, max-age=60"}
+        responses.add(
+            responses.GET,
+            url,
+            json={"error": {"httpStatusCode": 404}},
+            status=404,
+            headers=headers,
+        )
+        responses.add(
+            responses.GET,
+            url,
+            json={"entries": [{"content": {"version": "5.4.0"}}]},
+            status=200,
+            headers=headers,
+        )
+
+        assert "error" in client.get_installed_software_version()
+        first = client.get_installed_software_version()
+        first["entries"].clear()
+        second = client.get_installed_software_version()
+
+        assert second == {"entries": [{"content": {"version": "5.4.0"}}]}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_upgrade_sessions_always_revalidated(self, client):
+        """Test that upgrade sessions ignore max-age and revalidate each poll."""
+        sessions_response = {"entries": [{"content": {"id": "123"}}]}
+        url = "https://example.com/api/types/upgradeSession/instances"
+        responses.add(
+            responses.GET,
+            url,
+            json=sessions_response,
+            status=200,
+            headers={"ETag": '"v1"', "Cache-Control": "private, max-age=60"},
+        )
+        responses.add(responses.GET, url, status=304)
+
+        assert client.get_software_upgrade_sessions() == sessions_response
+        assert client.get_software_upgrade_sessions() == sessions_response
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_upgrade_session_workflow(self, client):
         """Test the complete upgrade session workflow."""
         # Mock login response
         responses.add(
@@ -173,14 +488,6 @@ class TestClientIntegration:
             },
         )
 
-        # Setup client
-        client = UnisphereClient(
-            base_url="https://example.com",
-            username="testuser",
-            password="testpass",
-            verify_ssl=True,
-        )
-
         # Mock upgrade sessions response
         sessions_response = {
             "entries": [
@@ -224,7 +531,7 @@ class TestClientIntegration:
         assert resume_result == resume_response
 
     @responses.activate
-    def test_upload_package_workflow(self):
+    def test_upload_package_workflow(self, client, tmp_path):
         """Test the package upload workflow."""
         # Mock login response
         responses.add(
@@ -238,14 +545,6 @@ class TestClientIntegration:
             },
         )
 
-        # Setup client
-        client = UnisphereClient(
-            base_url="https://example.com",
-            username="testuser",
-            password="testpass",
-            verify_ssl=True,
-        )
-
         # Mock upload response
         upload_response = {"content": {"id": "456", "version": "5.4.0.0.5.150"}}
         responses.add(
@@ -255,11 +554,18 @@ class TestClientIntegration:
             status=200,
         )
 
-        # We need to mock the file open operation
-        mock_file = MagicMock()
-        mock_file.read = MagicMock(return_value=b"mock file content")
+        package = tmp_path / "package.bin"
+        package.write_bytes(b"mock file content")
+
+        upload_result = client.upload_package(str(package))
+        assert upload_result == upload_response
 
-        # Execute workflow with mocked file open
-        with patch("builtins.open", mock_open(mock=mock_file)):
-            upload_result = client.upload_package("/path/to/package.bin")
-            assert upload_result == upload_response
+        # The package is sent as a multipart body named after the file
+        request = responses.calls[-1].request
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        # Sized body, not chunked transfer-encoding
+        assert "Transfer-Encoding" not in request.headers
+        assert int(request.headers["Content-Length"]) > package.stat().st_size
+        body = request.body if isinstance(request.body, bytes) else request.body.read()
+        assert b'filename="package.bin"' in body
+        assert b"mock file content" in body
@@ -1,6 +1,9 @@
 """Unit tests for the UnisphereClient class."""
 
+import logging
+
 import pytest
+import requests
 from unittest.mock import patch, MagicMock
 
 from dell_unisphere_client import UnisphereClient
@@ -201,6 +204,37 @@ class TestUnisphereClient:
             timeout=60,
         )
 
+    def test_get_software_upgrade_sessions_with_fields(
+        self, mock_requests, mock_response, sample_upgrade_sessions
+    ):
+        """Test get_software_upgrade_sessions joins iterable fields into the query."""
+        # Setup
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+        client.csrf_token = "test-token"
+        client.session = MagicMock()
+
+        # Create mock response
+        response = mock_response(json_data=sample_upgrade_sessions, status_code=200)
+
+        # Configure mock requests to return our response
+        mock_requests.get.return_value = response
+
+        # Call the method
+        result = client.get_software_upgrade_sessions(fields=("id", "status"))
+
+        # Assertions
+        assert result == sample_upgrade_sessions
+        mock_requests.get.assert_called_once_with(
+            "https://example.com/api/types/upgradeSession/instances",
+            params={"fields": "id,status"},
+            headers={"EMC-CSRF-TOKEN": "test-token"},
+            cookies={},
+            verify=True,
+            timeout=60,
+        )
+
     def test_verify_upgrade_eligibility(self, mock_requests, mock_response):
         """Test verify_upgrade_eligibility method."""
         # Setup
@@ -543,3 +577,306 @@ class TestUnisphereClient:
         )
         assert "files" in mock_requests.post.call_args[1]
         assert "headers" in mock_requests.post.call_args[1]
+
+    def test_httpx_transport_session(self):
+        """Test the httpx transport builds an HTTP/2 client with the auth header."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+        client = UnisphereClient(
+            base_url="https://example.com",
+            username="testuser",
+            password="testpass",
+            transport="httpx",
+        )
+        session = client._create_session()
+
+        assert isinstance(session, httpx.Client)
+        assert session.headers["Authorization"] == "Basic dGVzdHVzZXI6dGVzdHBhc3M="
+        session.close()
+
+    def test_send_request_adapts_kwargs_for_httpx(self):
+        """Test send_request drops per-request verify and sends bytes as content."""
+        httpx = pytest.importorskip("httpx")
+        from dell_unisphere_client.api.base import send_request
+
+        seen = {}
+
+        def handler(request):
+            seen["body"] = request.content
+            return httpx.Response(200, json={"content": {"id": "123"}})
+
+        session = httpx.Client(transport=httpx.MockTransport(handler))
+        response = send_request(
+            session,
+            "POST",
+            "https://example.com/api/types/upgradeSession/instances",
+            data=b'{"candidate":{"id":"1"}}',
+            verify=True,
+            timeout=60,
+        )
+
+        assert response.json() == {"content": {"id": "123"}}
+        assert seen["body"] == b'{"candidate":{"id":"1"}}'
+
+    def test_connection_errors_include_loaded_httpx(self):
+        """Test httpx transport errors are caught once httpx is imported."""
+        httpx = pytest.importorskip("httpx")
+        from dell_unisphere_client.api.base import connection_errors
+
+        assert httpx.TransportError in connection_errors()
+
+    def test_invalid_transport(self):
+        """Test that an unknown transport is rejected."""
+        with pytest.raises(ValueError):
+            UnisphereClient(
+                base_url="https://example.com",
+                username="testuser",
+                password="testpass",
+                transport="curl",
+            )
+
+    def test_verbose_enables_debug_logging(self):
+        """Test verbose raises the package logger to DEBUG for the dumps."""
+        package_logger = logging.getLogger("dell_unisphere_client")
+        level = package_logger.level
+        try:
+            package_logger.setLevel(logging.INFO)
+            UnisphereClient(
+                base_url="https://example.com",
+                username="testuser",
+                password="testpass",
+                verbose=True,
+            )
+            assert package_logger.level == logging.DEBUG
+        finally:
+            package_logger.setLevel(level)
+
+    def test_body_preview_truncates_large_bodies(self):
+        """Test body_preview only decodes a bounded prefix of the body."""
+        from dell_unisphere_client.api.base import body_preview
+
+        response = MagicMock()
+        response.content = b"<html>" + b"x" * 2000
+
+        preview = body_preview(response)
+
+        assert preview.startswith("<html>")
+        assert len(preview) == 512 + len("...")
+
+    def test_logout_is_best_effort(self):
+        """Test logout uses a short timeout and resets state when it fails."""
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+        client.csrf_token = "test-token"
+        session = client.session = MagicMock()
+        session.request.side_effect = Exception("Connection timed out")
+
+        result = client.logout()
+
+        assert result is True
+        assert client.session is None
+        assert client.csrf_token is None
+        assert session.request.call_args[1]["timeout"] == 2
+        session.close.assert_called_once()
+
+    def test_read_only_call_with_bad_credentials(self):
+        """Test a 401 on a read-only call raises and is never cached."""
+        from dell_unisphere_client.exceptions import AuthenticationError
+
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="wrong"
+        )
+        response = requests.Response()
+        response.status_code = 401
+        response.headers["Content-Type"] = "application/json"
+        response.headers["ETag"] = '"v1"'
+        response._content = b'{"error": {"httpStatusCode": 401}}'
+
+        with patch.object(requests.Session, "request", return_value=response):
+            with pytest.raises(AuthenticationError) as excinfo:
+                client.get_installed_software_version()
+
+        assert excinfo.value.status_code == 401
+        assert not client.software_api._response_cache
+
+    def test_session_mounts_pooled_adapter(self):
+        """Test the requests session mounts a sized adapter with retries."""
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+        session = client._create_session()
+        adapter = session.get_adapter("https://example.com")
+
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+        assert "POST" not in adapter.max_retries.allowed_methods
+        session.close()
+
+    def test_monitor_backs_off_while_stalled(self):
+        """Test the monitor polls less often while progress is stalled."""
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+        client._ensure_session()
+
+        def poll(percent, status=1):
+            return {
+                "entries": [{"content": {"status": status, "percentComplete": percent}}]
+            }
+
+        polls = [
+            poll(10),
+            poll(10),
+            poll(10),
+            poll(10),
+            poll(10),
+            poll(20),
+            poll(100, 2),
+        ]
+        with (
+            patch.object(
+                client.upgrade_api, "get_software_upgrade_sessions", side_effect=polls
+            ),
+            patch("dell_unisphere_client.api.upgrade.time.sleep") as mock_sleep,
+        ):
+            result = client.upgrade_api.monitor_upgrade_session(interval=10)
+
+        assert result["content"]["status"] == 2
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [10, 15, 22.5, 33.75, 40, 10]
+
+    def test_csrf_exemption_matches_exact_paths(self):
+        """Test only the known token-less endpoints skip the CSRF check."""
+        from dell_unisphere_client.api.base import BaseApiClient
+        from dell_unisphere_client.exceptions import CSRFTokenError
+
+        api = BaseApiClient("https://example.com", session=MagicMock())
+        with patch.object(api, "send") as mock_send:
+            api.request("POST", "/api/types/loginSessionInfo/instances")
+            assert mock_send.call_count == 1
+            with pytest.raises(CSRFTokenError):
+                api.request("POST", "/api/instances/foo/action/notauth")
+
+    def test_login_errors_keep_their_cause(self):
+        """Test login keeps the 401 status and chains transport errors."""
+        import requests
+
+        from dell_unisphere_client.exceptions import AuthenticationError
+
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+
+        with patch(
+            "dell_unisphere_client.client.send_request",
+            return_value=MagicMock(status_code=401),
+        ):
+            with pytest.raises(AuthenticationError) as excinfo:
+                client.login()
+        assert excinfo.value.status_code == 401
+
+        error = requests.exceptions.ConnectionError("refused")
+        with patch("dell_unisphere_client.client.send_request", side_effect=error):
+            with pytest.raises(AuthenticationError) as excinfo:
+                client.login()
+        assert excinfo.value.__cause__ is error
+        assert client.session is None
+
+    def test_clients_share_connection_pool(self):
+        """Test sessions for the same endpoint mount one shared adapter."""
+        kwargs = dict(base_url="https://example.com", password="testpass")
+        first = UnisphereClient(username="first", **kwargs)._create_session()
+        second = UnisphereClient(username="second", **kwargs)._create_session()
+
+        adapter = first.get_adapter("https://example.com")
+        assert second.get_adapter("https://example.com") is adapter
+        assert first.headers["Authorization"] != second.headers["Authorization"]
+
+    def test_handle_response_skips_decode_for_non_json(self):
+        """Test empty and non-JSON bodies map to the success result."""
+        import requests
+
+        from dell_unisphere_client.api.base import BaseApiClient
+
+        api = BaseApiClient("https://example.com")
+
+        def make(status, content, content_type=None):
+            response = requests.Response()
+            response.status_code = status
+            response._content = content
+            if content_type:
+                response.headers["Content-Type"] = content_type
+            return response
+
+        success = {"status": "success", "status_code": 204}
+        assert api.handle_response(make(204, b"")) == success
+        assert api.handle_response(make(204, b"{}", "text/plain")) == success
+        assert api.handle_response(
+            make(200, b'{"content": {}}', "application/json; version=1.0")
+        ) == {"content": {}}
+
+    def test_login_reused_within_auth_ttl(self):
+        """Test mutating calls only log in again once auth_ttl has expired."""
+        client = UnisphereClient(
+            base_url="https://example.com",
+            username="testuser",
+            password="testpass",
+            auth_ttl=60,
+        )
+
+        def fake_login():
+            client.session = MagicMock()
+            client._logged_in = True
+            client._login_time = now
+
+        now = 1000.0
+        with (
+            patch.object(client, "login", side_effect=fake_login) as mock_login,
+            patch("dell_unisphere_client.client.time.monotonic") as mock_monotonic,
+        ):
+            mock_monotonic.return_value = now
+            client._ensure_logged_in()
+            client._ensure_logged_in()
+            assert mock_login.call_count == 1
+
+            mock_monotonic.return_value = now + 61
+            client._ensure_logged_in()
+            assert mock_login.call_count == 2
+
+    def test_relogin_rebinds_api_clients(self):
+        """Test a re-login keeps the API clients and points them at the new session."""
+        client = UnisphereClient(
+            base_url="https://example.com", username="testuser", password="testpass"
+        )
+        client._ensure_session()
+        upgrade_api = client.upgrade_api
+
+        client.session = MagicMock()
+        client.csrf_token = "new-token"
+        client._initialize_api_clients()
+
+        assert client.upgrade_api is upgrade_api
+        assert upgrade_api.session is client.session
+        assert upgrade_api.csrf_token == "new-token"
+
+    def test_load_session_rejects_invalid_file(self, tmp_path):
+        """Test a corrupted session file is reported as ValueError."""
+        session_file = tmp_path / "session.json"
+        client = UnisphereClient(
+            base_url="https://example.com",
+            username="testuser",
+            password="testpass",
+            session_file=session_file,
+        )
+
+        assert client._load_session() is None
+
+        session_file.write_bytes(b'{"csrf_token": "test-token", "cookies": {}}')
+        assert client._load_session()["csrf_token"] == "test-token"
+
+        for content in (b"not json", b"[]"):
+            session_file.write_bytes(content)
+            with pytest.raises(ValueError):
+                client._load_session()
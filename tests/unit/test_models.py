@@ -0,0 +1,81 @@
+"""Unit tests for the models module."""
+
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from dell_unisphere_client.models import (
+    ApiResponse,
+    BasicSystemInfoResponse,
+    InstalledSoftwareVersion,
+    Link,
+    SoftwareUpgradeSession,
+    UpgradeSessionTypeEnum,
+    UpgradeStatusEnum,
+    UpgradeTypeEnum,
+)
+
+
+class TestModels:
+    """Test suite for the API response models."""
+
+    def test_models_are_slotted_and_frozen(self):
+        """Test that model instances carry no __dict__ and reject mutation."""
+        link = Link(rel="self", href="/api/types/upgradeSession/instances")
+
+        assert not hasattr(link, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            link.href = "/api/other"
+
+    def test_list_fields_default_to_fresh_lists(self):
+        """Test that defaulted list fields are empty and not shared."""
+        first, second = (
+            InstalledSoftwareVersion(
+                id=version_id,
+                version="5.3.0",
+                fullVersion="5.3.0.0.5.120",
+                isLatest=True,
+                releaseDate=datetime(2025, 1, 15),
+            )
+            for version_id in ("1", "2")
+        )
+
+        assert first.firmwarePackages == []
+        assert first.firmwarePackages is not second.firmwarePackages
+
+    def test_upgrade_session_optional_fields(self):
+        """Test that an upgrade session can be built without optional fields."""
+        session = SoftwareUpgradeSession(
+            id="123",
+            status=UpgradeStatusEnum.UPGRADING,
+            type=UpgradeSessionTypeEnum.UPGRADE,
+            upgradeType=UpgradeTypeEnum.SOFTWARE,
+            candidateVersionId="candidate_1",
+            candidateVersion="5.4.0.0.5.150",
+            percentComplete=45,
+            startTime=datetime(2025, 2, 15),
+        )
+
+        assert session.description is None
+        assert session.endTime is None
+        assert session.messages == []
+        assert session.tasks == []
+
+    def test_responses_share_api_response_fields(self):
+        """Test that collection responses inherit base, updated and links."""
+        response = BasicSystemInfoResponse(
+            base="https://example.com/api/types/basicSystemInfo/instances",
+            updated=datetime(2025, 3, 28),
+            links=[Link(rel="self", href="/api/types/basicSystemInfo/instances")],
+            entries=[],
+        )
+
+        assert isinstance(response, ApiResponse)
+        assert [f.name for f in dataclasses.fields(response)] == [
+            "base",
+            "updated",
+            "links",
+            "entries",
+        ]
+        assert not hasattr(response, "__dict__")
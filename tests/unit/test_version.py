@@ -30,6 +30,18 @@ class TestVersion:
             mock_version.assert_called_once_with("dell-unisphere-client")
             assert version == _VERSION
 
+    def test_get_version_does_not_reread_pyproject(self):
+        """Test that get_version reuses the version read at import time."""
+        with (
+            patch(
+                "dell_unisphere_client.version._read_version_from_pyproject"
+            ) as mock_read,
+            patch("importlib.metadata.version", return_value="1.2.3"),
+        ):
+            get_version()
+
+        mock_read.assert_not_called()
+
     def test_version_constant(self):
         """Test that __version__ is defined."""
         assert __version__ is not None